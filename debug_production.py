@@ -6,29 +6,40 @@ This script helps identify exactly where the command flow breaks.
 
 import asyncio
 import logging
+import logging.handlers
+import queue
 import sys
 import time
+from dataclasses import dataclass, field
+from datetime import datetime
 from unittest.mock import Mock, AsyncMock, patch
 
-# Setup path
-sys.path.insert(0, '/workspaces/hyundai_mqtt')
-
-# Configure extremely verbose logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - [%(levelname)8s] - %(name)s - %(funcName)s:%(lineno)d - %(message)s',
+# Configure extremely verbose logging, written from a background thread so the
+# event loop under test only pays for an in-memory enqueue per record
+log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+stderr_handler = logging.StreamHandler(sys.stderr)
+stderr_handler.setFormatter(logging.Formatter(
+    '%(asctime)s - [%(levelname)8s] - %(name)s - %(funcName)s:%(lineno)d - %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S'
-)
+))
+log_listener = logging.handlers.QueueListener(log_queue, stderr_handler, respect_handler_level=True)
+logging.basicConfig(level=logging.DEBUG, handlers=[logging.handlers.QueueHandler(log_queue)])
 
 from src.mqtt.client import MQTTClient
 from src.commands.handler import CommandHandler
 from src.config.settings import MQTTConfig
 from src.hyundai.data_mapper import VehicleData
 
+@dataclass
+class MockStatus:
+    last_updated: datetime = field(default_factory=datetime.utcnow)
+
+
 # Create mock API client
 class MockAPIClient:
     def __init__(self):
         self.call_count = 0
+        self.called_event = asyncio.Event()  # Set once a refresh has completed
     
     async def refresh_force(self, vehicle_id):
         self.call_count += 1
@@ -36,19 +47,13 @@ class MockAPIClient:
         await asyncio.sleep(0.1)  # Simulate API call
         
         # Create mock vehicle data
-        from datetime import datetime
-        from dataclasses import dataclass
-        
-        @dataclass
-        class MockStatus:
-            last_updated: datetime = datetime.utcnow()
-        
         mock_data = Mock(spec=VehicleData)
         mock_data.vehicle_id = vehicle_id
         mock_data.status = MockStatus()
-        mock_data.to_mqtt_messages = Mock(return_value=[])
+        mock_data.iter_mqtt_messages = Mock(return_value=iter(()))
         
         logging.info(f"✅ MockAPIClient.refresh_force completed for vehicle: {vehicle_id}")
+        self.called_event.set()
         return mock_data
     
     async def refresh_cached(self, vehicle_id):
@@ -69,6 +74,7 @@ async def test_production_flow():
     test_vehicle_id = "fb9ccccc-11111111-1111-1111-1111-111111111111"
     test_topic = f"hyundai/{test_vehicle_id}/commands/refresh"
     test_payload = "force"
+    test_payload_bytes = test_payload.encode('utf-8')  # paho delivers raw bytes
     
     print(f"Configuration:")
     print(f"  - Vehicle ID: {test_vehicle_id}")
@@ -83,6 +89,9 @@ async def test_production_flow():
     mock_mqtt_publish = Mock()
     mock_mqtt_publish.publish_vehicle_data = AsyncMock()
     mock_mqtt_publish.publish_error_status = AsyncMock()
+    mock_mqtt_publish.publish_batch = AsyncMock()
+    mock_mqtt_publish.vehicle_data_messages = Mock(return_value=[])
+    mock_mqtt_publish.error_status_message = Mock(return_value=("hyundai/test/status/error", "{}", 0, True))
     
     # Create command handler
     command_handler = CommandHandler(mock_api, mock_mqtt_publish)  # type: ignore
@@ -143,11 +152,11 @@ async def test_production_flow():
     print(f"  Payload: {test_payload}")
     
     class FakeMessage:
-        def __init__(self, topic, payload):
+        def __init__(self, topic: str, payload: bytes):
             self.topic = topic
-            self.payload = payload.encode('utf-8')
+            self.payload = payload
     
-    fake_msg = FakeMessage(test_topic, test_payload)
+    fake_msg = FakeMessage(test_topic, test_payload_bytes)
     
     # Call the _on_message handler (this simulates what paho-mqtt does)
     print("  🔄 Calling _on_message handler...")
@@ -161,15 +170,15 @@ async def test_production_flow():
     
     # Wait up to 5 seconds for command to be processed
     max_wait = 5.0
-    start_time = time.time()
+    start_time = time.monotonic()
     initial_call_count = mock_api.call_count
     
-    while time.time() - start_time < max_wait:
-        await asyncio.sleep(0.1)
-        if mock_api.call_count > initial_call_count:
-            break
+    try:
+        await asyncio.wait_for(mock_api.called_event.wait(), timeout=max_wait)
+    except asyncio.TimeoutError:
+        pass
     
-    elapsed = time.time() - start_time
+    elapsed = time.monotonic() - start_time
     
     print(f"  ⏱️  Waited {elapsed:.2f} seconds")
     print()
@@ -180,8 +189,7 @@ async def test_production_flow():
     print(f"API refresh_force called: {mock_api.call_count > initial_call_count}")
     print(f"Total API calls: {mock_api.call_count}")
     print(f"Queue size after processing: {command_handler._command_queue.qsize()}")
-    print(f"publish_vehicle_data called: {mock_mqtt_publish.publish_vehicle_data.called}")
-    print(f"publish_error_status called: {mock_mqtt_publish.publish_error_status.called}")
+    print(f"publish_batch called: {mock_mqtt_publish.publish_batch.called}")
     print()
     
     # Diagnosis
@@ -226,6 +234,7 @@ if __name__ == "__main__":
     print("\n⚙️  Starting production debugging session...")
     print("This script will test the MQTT command flow with enhanced logging.\n")
     
+    log_listener.start()
     try:
         asyncio.run(test_production_flow())
     except KeyboardInterrupt:
@@ -234,3 +243,5 @@ if __name__ == "__main__":
         print(f"\n\n❌ Test failed with exception: {e}\n")
         import traceback
         traceback.print_exc()
+    finally:
+        log_listener.stop()
@@ -1,38 +1,83 @@
 """Command parsing and execution for MQTT commands."""
 
+from __future__ import annotations
+
 import asyncio
-import json
+import math
+import re
+import time
+import uuid
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from datetime import datetime, timedelta
+from typing import (
+    Any, Awaitable, Callable, ClassVar, Deque, Dict, Optional, Set, Tuple, Union, TYPE_CHECKING
+)
 
+from ..hyundai.api_client import EU_COMMAND_TIMEOUTS
 from ..utils.errors import CommandError
 from ..utils.logger import get_logger
+from ..utils.serialization import json_loads
 
 if TYPE_CHECKING:
     from ..hyundai.api_client import HyundaiAPIClient
+    from ..hyundai.data_mapper import VehicleData
     from ..mqtt.client import MQTTClient
 
 logger = get_logger(__name__)
 
+# Refresh command topic: {base_topic}/{vehicle_id}/commands/refresh
+_REFRESH_TOPIC_RE = re.compile(r"[^/]+/([^/]+)/commands/refresh\Z")
+# Vehicle IDs: ASCII alphanumerics, underscore and hyphen
+_VEHICLE_ID_RE = re.compile(r"[A-Za-z0-9_-]{1,128}\Z")
+# Valid refresh strategies
+_VALID_REFRESH_TYPES = frozenset(("cached", "force", "smart"))
+# Valid control command parameter values
+_VALID_LOCK_ACTIONS = frozenset(("lock", "unlock"))
+_VALID_CLIMATE_ACTIONS = frozenset(("start_climate", "stop_climate"))
+_VALID_CHARGE_ACTIONS = frozenset(("open", "close"))
+_VALID_WINDOW_STATES = frozenset((0, 1, 2))  # CLOSED, OPEN, VENTILATION
+_VALID_CURRENT_LEVELS = frozenset((1, 2, 3))  # 100%, 90%, 60%
+# Action statuses that end an ActionTracker's lifecycle
+_TERMINAL_STATUSES = frozenset(("SUCCESS", "FAILED", "TIMEOUT", "UNKNOWN"))
+# Status transitions kept per ActionTracker (typical lifecycles have far fewer)
+_STATUS_HISTORY_LEN = 16
+# Naive UTC epoch for converting time.time_ns() stamps at publish time
+_EPOCH = datetime(1970, 1, 1)
+# Refresh command payload: b"cached", b"force" or b"smart:<max_age_seconds>".
+# Matched against the raw MQTT bytes so no UTF-8 decode is needed. Anything
+# after a colon is captured as-is: cached and force ignore it, smart parses it.
+_REFRESH_PAYLOAD_RE = re.compile(
+    b"(" + b"|".join(t.encode("ascii") for t in sorted(_VALID_REFRESH_TYPES)) + rb")\s*(?::(.*))?",
+    re.DOTALL,
+)
+# Smart command max_age parameter: decimal digits, surrounding whitespace allowed
+_MAX_AGE_RE = re.compile(rb"\s*([0-9]+)\s*")
+
+# Fixed messages for parse failures; a fresh CommandError is raised each time
+# so no shared instance carries another exception's __context__ or traceback
+_ERR_EMPTY_TOPIC = "Invalid topic: must be a non-empty string"
+_ERR_EMPTY_PAYLOAD = "Invalid payload: must be non-empty bytes"
+_ERR_SMART_MISSING_MAX_AGE = "Smart command requires max_age parameter (e.g., 'smart:300')"
+
+
+def _ns_to_datetime(ns: int) -> datetime:
+    """Convert a time.time_ns() stamp to a naive UTC datetime."""
+    return _EPOCH + timedelta(microseconds=ns // 1000)
+
 
 # ===== Control Command Dataclasses =====
 
-@dataclass
 class ControlCommand:
-    """Base class for control commands."""
-    command_type: str  # "lock", "unlock", "climate", etc.
-    vehicle_id: str
-    payload: Dict[str, Any]
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    """Entry point for parsing control commands into their specific types."""
     
     @staticmethod
-    def parse(topic: str, payload: str, topic_manager: Any) -> 'ControlCommand':
+    def parse(topic: str, payload: bytes, topic_manager: Any) -> AnyControlCommand:
         """
-        Parse MQTT command topic and payload to ControlCommand.
+        Parse MQTT command topic and payload straight to the command's type.
         
         Topic format: hyundai/{vehicle_id}/commands/{command_type}
-        Payload: JSON string with command parameters
+        Payload: raw UTF-8 JSON bytes with command parameters
         """
         parsed = topic_manager.parse_command_topic(topic)
         if not parsed:
@@ -40,40 +85,39 @@ class ControlCommand:
         
         vehicle_id, command_type = parsed
         
-        try:
-            payload_dict = json.loads(payload)
-        except json.JSONDecodeError as e:
-            raise CommandError(f"Invalid JSON payload: {e}")
-        
         # Validate command type
-        valid_types = ["lock", "climate", "windows", "charge_port", "charging_current"]
-        if command_type not in valid_types:
+        parser = _CONTROL_PARSERS.get(command_type)
+        if parser is None:
             raise CommandError(f"Invalid command type: {command_type}")
         
-        return ControlCommand(
-            command_type=command_type,
-            vehicle_id=vehicle_id,
-            payload=payload_dict
-        )
+        try:
+            payload_dict = json_loads(payload)
+        except ValueError as e:
+            raise CommandError(f"Invalid JSON payload: {e}")
+        if not isinstance(payload_dict, dict):
+            raise CommandError("Invalid JSON payload: expected an object")
+        
+        return parser(payload_dict, vehicle_id)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LockCommand:
     """Lock/unlock command."""
+    command_type: ClassVar[str] = "lock"
+    timeout_seconds: ClassVar[int] = EU_COMMAND_TIMEOUTS["lock"]
     action: str  # "lock" or "unlock"
     vehicle_id: str
     
     @staticmethod
-    def from_control_command(cmd: ControlCommand) -> 'LockCommand':
-        action = cmd.payload.get("action")
-        if action not in ["lock", "unlock"]:
-            raise CommandError(f"Invalid lock action: {action}")
-        return LockCommand(action=action, vehicle_id=cmd.vehicle_id)
+    def from_payload(payload: Dict[str, Any], vehicle_id: str) -> LockCommand:
+        return _parse_lock(payload, vehicle_id)
 
 
-@dataclass
+@dataclass(slots=True)
 class ClimateCommand:
     """Climate control command."""
+    command_type: ClassVar[str] = "climate"
+    timeout_seconds: ClassVar[int] = EU_COMMAND_TIMEOUTS["climate"]
     action: str  # "start_climate" or "stop_climate"
     vehicle_id: str
     set_temp: Optional[float] = None
@@ -87,29 +131,15 @@ class ClimateCommand:
     rear_right_seat: Optional[int] = None  # 0-8
     
     @staticmethod
-    def from_control_command(cmd: ControlCommand) -> 'ClimateCommand':
-        action = cmd.payload.get("action")
-        if action not in ["start_climate", "stop_climate"]:
-            raise CommandError(f"Invalid climate action: {action}")
-        
-        return ClimateCommand(
-            action=action,
-            vehicle_id=cmd.vehicle_id,
-            set_temp=cmd.payload.get("set_temp"),
-            duration=cmd.payload.get("duration"),
-            defrost=cmd.payload.get("defrost"),
-            climate=cmd.payload.get("climate"),
-            steering_wheel=cmd.payload.get("steering_wheel"),
-            front_left_seat=cmd.payload.get("front_left_seat"),
-            front_right_seat=cmd.payload.get("front_right_seat"),
-            rear_left_seat=cmd.payload.get("rear_left_seat"),
-            rear_right_seat=cmd.payload.get("rear_right_seat"),
-        )
+    def from_payload(payload: Dict[str, Any], vehicle_id: str) -> ClimateCommand:
+        return _parse_climate(payload, vehicle_id)
 
 
-@dataclass
+@dataclass(slots=True)
 class WindowsCommand:
     """Window control command."""
+    command_type: ClassVar[str] = "windows"
+    timeout_seconds: ClassVar[int] = EU_COMMAND_TIMEOUTS["windows"]
     vehicle_id: str
     front_left: Optional[int] = None  # 0=CLOSED, 1=OPEN, 2=VENTILATION
     front_right: Optional[int] = None
@@ -117,71 +147,209 @@ class WindowsCommand:
     back_right: Optional[int] = None
     
     @staticmethod
-    def from_control_command(cmd: ControlCommand) -> 'WindowsCommand':
-        # Validate window state values
-        for key in ["front_left", "front_right", "back_left", "back_right"]:
-            value = cmd.payload.get(key)
-            if value is not None and value not in [0, 1, 2]:
-                raise CommandError(f"Invalid window state for {key}: {value}")
-        
-        return WindowsCommand(
-            vehicle_id=cmd.vehicle_id,
-            front_left=cmd.payload.get("front_left"),
-            front_right=cmd.payload.get("front_right"),
-            back_left=cmd.payload.get("back_left"),
-            back_right=cmd.payload.get("back_right"),
-        )
+    def from_payload(payload: Dict[str, Any], vehicle_id: str) -> WindowsCommand:
+        return _parse_windows(payload, vehicle_id)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChargePortCommand:
     """Charge port control command."""
+    command_type: ClassVar[str] = "charge_port"
+    timeout_seconds: ClassVar[int] = EU_COMMAND_TIMEOUTS["charge_port"]
     action: str  # "open" or "close"
     vehicle_id: str
     
     @staticmethod
-    def from_control_command(cmd: ControlCommand) -> 'ChargePortCommand':
-        action = cmd.payload.get("action")
-        if action not in ["open", "close"]:
-            raise CommandError(f"Invalid charge port action: {action}")
-        return ChargePortCommand(action=action, vehicle_id=cmd.vehicle_id)
+    def from_payload(payload: Dict[str, Any], vehicle_id: str) -> ChargePortCommand:
+        return _parse_charge_port(payload, vehicle_id)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChargingCurrentCommand:
     """Charging current control command (EU-only)."""
+    command_type: ClassVar[str] = "charging_current"
+    timeout_seconds: ClassVar[int] = EU_COMMAND_TIMEOUTS["charging_current"]
     level: int  # 1=100%, 2=90%, 3=60%
     vehicle_id: str
     
     @staticmethod
-    def from_control_command(cmd: ControlCommand) -> 'ChargingCurrentCommand':
-        level = cmd.payload.get("level")
-        if level not in [1, 2, 3]:
-            raise CommandError(f"Invalid charging current level: {level}. Must be 1, 2, or 3.")
-        return ChargingCurrentCommand(level=level, vehicle_id=cmd.vehicle_id)
+    def from_payload(payload: Dict[str, Any], vehicle_id: str) -> ChargingCurrentCommand:
+        return _parse_charging_current(payload, vehicle_id)
+
+
+# ===== Control Command Parsers =====
+
+# Field spec: (name, required, converter or None to pass the value through,
+# allowed values or None for any, error format for disallowed values). Specs
+# are resolved once at import, so per-command parsing is a fixed walk of dict
+# lookups, converter calls and set probes. None is accepted for every optional
+# field.
+_FieldSpec = Tuple[str, bool, Optional[Callable[[str, Any], Any]], Optional[frozenset], Optional[str]]
+
+# Converters normalise the stringly-typed values some MQTT publishers send
+# (e.g. "2", 2.0 or "true") and reject anything else with a CommandError.
+# JSON true/false decode to bool, an int subclass, so bools are checked by class.
+_TRUE_STRINGS = frozenset(("true", "1"))
+_FALSE_STRINGS = frozenset(("false", "0"))
+
+
+def _invalid(name: str, expected: str, value: Any) -> CommandError:
+    return CommandError(f"Invalid {name}: expected {expected}, got {value!r}")
 
 
-@dataclass
+def _to_int(name: str, value: Any) -> int:
+    """Accept ints, integral floats and decimal integer strings."""
+    cls = value.__class__
+    if cls is int:
+        return value
+    if cls is float and value.is_integer():
+        return int(value)
+    if cls is str:
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    raise _invalid(name, "int", value)
+
+
+def _to_number(name: str, value: Any) -> Union[int, float]:
+    """Accept ints, floats and finite numeric strings."""
+    cls = value.__class__
+    if cls is int or cls is float:
+        return value
+    if cls is str:
+        try:
+            number = float(value)
+        except ValueError:
+            pass
+        else:
+            if math.isfinite(number):
+                return number
+    raise _invalid(name, "int/float", value)
+
+
+def _to_bool(name: str, value: Any) -> bool:
+    """Accept bools, 0/1 and "true"/"false" strings (case-insensitive)."""
+    cls = value.__class__
+    if cls is bool:
+        return value
+    if cls is int and (value == 0 or value == 1):
+        return value == 1
+    if cls is str:
+        lowered = value.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+    raise _invalid(name, "bool", value)
+
+
+def _make_parser(
+    cls: type, spec: Tuple[_FieldSpec, ...]
+) -> Callable[[Dict[str, Any], str], Any]:
+    """Build a payload parser that validates spec fields and constructs cls."""
+    def parse(payload: Dict[str, Any], vehicle_id: str) -> Any:
+        get = payload.get
+        kwargs = {"vehicle_id": vehicle_id}
+        for name, required, convert, allowed, error in spec:
+            value = get(name)
+            if value is not None and convert is not None:
+                value = convert(name, value)
+            if allowed is not None and (required or value is not None):
+                try:
+                    valid = value in allowed
+                except TypeError:  # unhashable JSON value (list/object)
+                    valid = False
+                if not valid:
+                    raise CommandError(error.format(key=name, value=value))
+            kwargs[name] = value
+        return cls(**kwargs)
+    parse.__name__ = parse.__qualname__ = f"_parse_{cls.__name__}"
+    return parse
+
+
+_parse_lock = _make_parser(LockCommand, (
+    ("action", True, None, _VALID_LOCK_ACTIONS, "Invalid lock action: {value}"),
+))
+_parse_climate = _make_parser(ClimateCommand, (
+    ("action", True, None, _VALID_CLIMATE_ACTIONS, "Invalid climate action: {value}"),
+    ("set_temp", False, _to_number, None, None),
+    ("duration", False, _to_int, None, None),
+    ("defrost", False, _to_bool, None, None),
+    ("climate", False, _to_bool, None, None),
+    ("steering_wheel", False, _to_int, None, None),
+    ("front_left_seat", False, _to_int, None, None),
+    ("front_right_seat", False, _to_int, None, None),
+    ("rear_left_seat", False, _to_int, None, None),
+    ("rear_right_seat", False, _to_int, None, None),
+))
+_parse_windows = _make_parser(WindowsCommand, tuple(
+    (key, False, _to_int, _VALID_WINDOW_STATES, "Invalid window state for {key}: {value}")
+    for key in ("front_left", "front_right", "back_left", "back_right")
+))
+_parse_charge_port = _make_parser(ChargePortCommand, (
+    ("action", True, None, _VALID_CHARGE_ACTIONS, "Invalid charge port action: {value}"),
+))
+_parse_charging_current = _make_parser(ChargingCurrentCommand, (
+    ("level", True, _to_int, _VALID_CURRENT_LEVELS,
+     "Invalid charging current level: {value}. Must be 1, 2, or 3."),
+))
+
+AnyControlCommand = Union[
+    LockCommand, ClimateCommand, WindowsCommand, ChargePortCommand, ChargingCurrentCommand
+]
+
+# Payload parser per command topic suffix
+_CONTROL_PARSERS: Dict[str, Callable[[Dict[str, Any], str], AnyControlCommand]] = {
+    cls.command_type: cls.from_payload
+    for cls in (LockCommand, ClimateCommand, WindowsCommand, ChargePortCommand, ChargingCurrentCommand)
+}
+
+
+@dataclass(slots=True)
 class ActionTracker:
     """Track lifecycle of vehicle control actions."""
     action_id: str
     request_id: str
     command_type: str
     vehicle_id: str
-    started_at: datetime
+    started_at: int  # time.time_ns()
+    timeout_seconds: int = 60  # Status polling deadline, bound from the command class
     last_status: Optional[str] = None  # "PENDING", "SUCCESS", "FAILED", "TIMEOUT", "UNKNOWN"
-    completed_at: Optional[datetime] = None
+    completed_at: Optional[int] = None  # time.time_ns()
     error_message: Optional[str] = None
-    status_history: List[Tuple[datetime, str]] = field(default_factory=list)
+    # Most recent (time.time_ns(), status) transitions; bounded for long polls
+    status_history: Deque[Tuple[int, str]] = field(
+        default_factory=lambda: deque(maxlen=_STATUS_HISTORY_LEN)
+    )
+    # Formatted timestamps, cached since each stamp is set at most once
+    _started_at_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _completed_at_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def started_at_iso(self) -> str:
+        """started_at as an ISO 8601 UTC string."""
+        if self._started_at_iso is None:
+            self._started_at_iso = _ns_to_datetime(self.started_at).isoformat() + "Z"
+        return self._started_at_iso
+    
+    @property
+    def completed_at_iso(self) -> Optional[str]:
+        """completed_at as an ISO 8601 UTC string, or None while in progress."""
+        if self._completed_at_iso is None and self.completed_at is not None:
+            self._completed_at_iso = _ns_to_datetime(self.completed_at).isoformat() + "Z"
+        return self._completed_at_iso
     
     def update_status(self, status: str, error: Optional[str] = None) -> None:
         """Update action status and record in history."""
+        now = time.time_ns()
         self.last_status = status
-        self.status_history.append((datetime.utcnow(), status))
+        self.status_history.append((now, status))
         if error:
             self.error_message = error
-        if status in ["SUCCESS", "FAILED", "TIMEOUT", "UNKNOWN"]:
-            self.completed_at = datetime.utcnow()
+        if status in _TERMINAL_STATUSES:
+            self.completed_at = now
+            self._completed_at_iso = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for MQTT publishing."""
@@ -190,79 +358,84 @@ class ActionTracker:
             "request_id": self.request_id,
             "command_type": self.command_type,
             "vehicle_id": self.vehicle_id,
-            "started_at": self.started_at.isoformat() + "Z",
+            "started_at": self.started_at_iso,
             "last_status": self.last_status,
-            "completed_at": self.completed_at.isoformat() + "Z" if self.completed_at else None,
+            "completed_at": self.completed_at_iso,
             "error_message": self.error_message,
         }
 
 
 # ===== Refresh Command Dataclass =====
 
-@dataclass
+@dataclass(slots=True)
 class RefreshCommand:
     """Parsed refresh command from MQTT."""
     command_type: str  # "cached", "force", "smart"
     vehicle_id: str
     max_age_seconds: Optional[int] = None
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: float = field(default_factory=time.time)  # Receipt time, epoch seconds
 
     @staticmethod
-    def parse(topic: str, payload: str) -> 'RefreshCommand':
+    def parse(topic: str, payload: bytes) -> RefreshCommand:
         """
         Parse MQTT message to RefreshCommand.
 
         Topic format: hyundai/{vehicle_id}/commands/refresh
-        Payload examples: "cached", "force", "smart:300"
+        Payload examples: b"cached", b"force", b"smart:300"
         """
         # Validate inputs
         if not topic or not isinstance(topic, str):
-            raise CommandError("Invalid topic: must be a non-empty string")
+            raise CommandError(_ERR_EMPTY_TOPIC)
         
-        if not payload or not isinstance(payload, str):
-            raise CommandError("Invalid payload: must be a non-empty string")
+        if not payload or not isinstance(payload, bytes):
+            raise CommandError(_ERR_EMPTY_PAYLOAD)
         
         # Extract vehicle_id from topic
-        parts = topic.split("/")
-        vehicle_id = parts[1] if len(parts) > 1 else None
-        
-        if not vehicle_id:
+        topic_match = _REFRESH_TOPIC_RE.match(topic)
+        if not topic_match:
             raise CommandError(f"Could not extract vehicle_id from topic: {topic}")
+        vehicle_id = topic_match.group(1)
         
         # Validate vehicle_id format (alphanumeric, underscore, hyphen)
-        if not vehicle_id.replace("_", "").replace("-", "").isalnum():
+        if not _VEHICLE_ID_RE.match(vehicle_id):
             raise CommandError(f"Invalid vehicle_id format: {vehicle_id}")
         
         # Parse command type and parameters
-        payload = payload.strip()
-        if ":" in payload:
-            cmd_type, param = payload.split(":", 1)
-            cmd_type = cmd_type.strip()
-            
-            if cmd_type == "smart":
-                try:
-                    max_age = int(param.strip())
-                    # Validate max_age is reasonable (between 1 second and 7 days)
-                    if max_age < 1 or max_age > 604800:
-                        raise CommandError(
-                            f"Invalid max_age value: {max_age}. Must be between 1 and 604800 seconds."
-                        )
-                except ValueError:
-                    raise CommandError(f"Invalid max_age parameter for smart command: {param}")
-            else:
-                max_age = None
+        payload_match = _REFRESH_PAYLOAD_RE.fullmatch(payload.strip())
+        if not payload_match:
+            raise CommandError(
+                f"Invalid command: {payload.strip().decode('utf-8', 'replace')}. "
+                "Must be 'cached', 'force', or 'smart:<seconds>'"
+            )
+        # The command name group only matches ASCII, so this decode cannot fail
+        cmd_type = payload_match.group(1).decode("ascii")
+        param = payload_match.group(2)
+        
+        if cmd_type == "smart":
+            # Validate smart command has max_age
+            if param is None:
+                raise CommandError(_ERR_SMART_MISSING_MAX_AGE)
+            digits_match = _MAX_AGE_RE.fullmatch(param)
+            if not digits_match:
+                raise CommandError(
+                    f"Invalid max_age parameter for smart command: {param.decode('utf-8', 'replace')}"
+                )
+            param = digits_match.group(1)
+            # Reject oversized digit strings before int() has to convert them
+            if len(param) > 7:
+                raise CommandError(
+                    f"Invalid max_age value: {param[:7].decode('ascii')}... Must be between 1 and 604800 seconds."
+                )
+            # int() parses ASCII digit bytes directly
+            max_age = int(param)
+            # Validate max_age is reasonable (between 1 second and 7 days)
+            if max_age < 1 or max_age > 604800:
+                raise CommandError(
+                    f"Invalid max_age value: {max_age}. Must be between 1 and 604800 seconds."
+                )
         else:
-            cmd_type = payload
             max_age = None
         
-        # Validate command type
-        if cmd_type not in ["cached", "force", "smart"]:
-            raise CommandError(f"Invalid command type: {cmd_type}. Must be 'cached', 'force', or 'smart'")
-        
-        # Validate smart command has max_age
-        if cmd_type == "smart" and max_age is None:
-            raise CommandError("Smart command requires max_age parameter (e.g., 'smart:300')")
-        
         return RefreshCommand(
             command_type=cmd_type,
             vehicle_id=vehicle_id,
@@ -275,63 +448,92 @@ class CommandHandler:
     Processes MQTT commands and coordinates refresh operations.
     """
 
-    def __init__(self, api_client: 'HyundaiAPIClient', mqtt_client: 'MQTTClient') -> None:
-        self.api_client: 'HyundaiAPIClient' = api_client
-        self.mqtt_client: 'MQTTClient' = mqtt_client
-        self._command_queue: asyncio.Queue[RefreshCommand] = asyncio.Queue()
-        self._control_command_queue: asyncio.Queue[ControlCommand] = asyncio.Queue()  # Separate queue for control commands
-        self._last_command_time: dict[str, datetime] = {}
+    def __init__(self, api_client: HyundaiAPIClient, mqtt_client: MQTTClient) -> None:
+        self.api_client: HyundaiAPIClient = api_client
+        self.mqtt_client: MQTTClient = mqtt_client
+        # Bounded so a flooding publisher cannot grow the queues without limit
+        self._command_queue: asyncio.Queue[RefreshCommand] = asyncio.Queue(maxsize=256)
+        self._dropped_commands: int = 0
+        # Separate queue for control commands
+        self._control_command_queue: asyncio.Queue[AnyControlCommand] = asyncio.Queue(maxsize=256)
+        self._dropped_control_commands: int = 0
+        # time.monotonic() of last command per vehicle, bounded LRU
+        self._last_command_time: OrderedDict[str, float] = OrderedDict()
+        self._max_tracked_vehicles: int = 1024
         self._min_command_interval: int = 5  # Minimum seconds between commands for same vehicle
-        self._active_actions: Dict[str, ActionTracker] = {}  # Track active actions by action_id
+        # Track active actions by action_id, oldest evicted past the cap
+        self._active_actions: OrderedDict[str, ActionTracker] = OrderedDict()
+        self._max_active_actions: int = 1000
+        # Refresh strategies that only take a vehicle_id ("smart" also needs max_age_seconds)
+        self._refresh_dispatch: Dict[str, Callable[[str], Awaitable[VehicleData]]] = {
+            "cached": api_client.refresh_cached,
+            "force": api_client.refresh_force,
+        }
+        # Control command handlers keyed by command_type
+        self._control_dispatch: Dict[str, Callable[[Any], Awaitable[str]]] = {
+            "lock": self._do_lock,
+            "climate": self._do_climate,
+            "windows": self._do_windows,
+            "charge_port": self._do_charge_port,
+            "charging_current": self._do_charging_current,
+        }
+        self._cmd_count: int = 0  # Refresh commands processed, used to sample loop debug logs
+        # Whether the retained error status may be set, per vehicle, bounded LRU
+        # (a forgotten vehicle reads as True, which only re-sends the clear)
+        self._last_error: OrderedDict[str, bool] = OrderedDict()
+        # Refreshes waiting in _command_queue, keyed by (vehicle_id, command_type,
+        # max_age_seconds); duplicates are dropped at enqueue
+        self._pending_refresh_keys: Set[Tuple[str, str, Optional[int]]] = set()
 
     async def handle_command(self, command: RefreshCommand) -> None:
         """Execute refresh command and publish results."""
         vehicle_id = command.vehicle_id
         try:
             # Check for command throttling
-            current_time = datetime.utcnow()
+            now = time.monotonic()
+            last = self._last_command_time.get(vehicle_id)
             
-            if vehicle_id in self._last_command_time:
-                elapsed = (current_time - self._last_command_time[vehicle_id]).total_seconds()
-                if elapsed < self._min_command_interval:
-                    logger.warning(
-                        f"Command throttled for vehicle {vehicle_id} "
-                        f"(elapsed: {elapsed:.1f}s < {self._min_command_interval}s)"
-                    )
-                    return
+            if last is not None and now - last < self._min_command_interval:
+                logger.warning(
+                    "Command throttled for vehicle %s (elapsed: %.1fs < %ss)",
+                    vehicle_id, now - last, self._min_command_interval
+                )
+                return
             
-            self._last_command_time[vehicle_id] = current_time
+            self._last_command_time[vehicle_id] = now
+            self._last_command_time.move_to_end(vehicle_id)
+            if len(self._last_command_time) > self._max_tracked_vehicles:
+                # Oldest entry is far past the throttle window, safe to forget
+                self._last_command_time.popitem(last=False)
             
             logger.info(
-                f"Executing {command.command_type} command for vehicle {vehicle_id}"
+                "Executing %s command for vehicle %s", command.command_type, vehicle_id
             )
             
-            # Execute appropriate refresh strategy
-            if command.command_type == "cached":
-                data = await self.api_client.refresh_cached(command.vehicle_id)
-            elif command.command_type == "force":
-                data = await self.api_client.refresh_force(command.vehicle_id)
-            elif command.command_type == "smart":
-                # max_age_seconds is guaranteed to be set for smart commands by validation in parse()
-                assert command.max_age_seconds is not None, "Smart command must have max_age_seconds"
-                data = await self.api_client.refresh_smart(
-                    command.vehicle_id,
-                    command.max_age_seconds
-                )
-            else:
-                raise CommandError(f"Unknown command type: {command.command_type}")
-            
-            # Publish updated data to MQTT
-            await self.mqtt_client.publish_vehicle_data(data)
+            # Execute appropriate refresh strategy; the API client shares identical
+            # in-flight refreshes
+            data = await self._refresh(
+                vehicle_id, command.command_type, command.max_age_seconds
+            )
             
-            # Publish success status
-            await self.mqtt_client.publish_error_status(vehicle_id, None)
+            # Publish updated data, clearing the retained error status in the same
+            # batch only if an error may still be set (unknown vehicles included,
+            # since a previous run can have left one on the broker)
+            messages = self.mqtt_client.vehicle_data_messages(data)
+            clear_error = self._last_error.get(vehicle_id, True)
+            if clear_error:
+                messages.append(self.mqtt_client.error_status_message(vehicle_id, None))
+            # Only remember the error as cleared once the clear actually went out;
+            # otherwise the next success retries it
+            if await self.mqtt_client.publish_batch(messages) and clear_error:
+                self._mark_error(vehicle_id, False)
             
-            logger.info(f"Command executed successfully for vehicle {vehicle_id}")
+            logger.info("Command executed successfully for vehicle %s", vehicle_id)
             
         except Exception as e:
-            logger.error(f"Command execution failed for vehicle {vehicle_id}: {e}")
+            logger.error("Command execution failed for vehicle %s: %s", vehicle_id, e)
             # Publish error status to MQTT for monitoring
+            self._mark_error(vehicle_id, True)
             try:
                 await self.mqtt_client.publish_error_status(
                     vehicle_id,
@@ -339,25 +541,61 @@ class CommandHandler:
                         "error": str(e),
                         "error_type": type(e).__name__,
                         "command_type": command.command_type,
-                        "timestamp": datetime.utcnow().isoformat() + "Z"
+                        "timestamp": datetime.utcnow()  # formatted by json_dumps
                     }
                 )
             except Exception as pub_error:
-                logger.error(f"Failed to publish error status: {pub_error}")
+                logger.error("Failed to publish error status: %s", pub_error)
+
+    def _mark_error(self, vehicle_id: str, error_set: bool) -> None:
+        """Record whether vehicle_id's retained error status may be set."""
+        self._last_error[vehicle_id] = error_set
+        self._last_error.move_to_end(vehicle_id)
+        if len(self._last_error) > self._max_tracked_vehicles:
+            self._last_error.popitem(last=False)
 
-    async def enqueue_command(self, topic: str, payload: str) -> None:
+    async def _refresh(
+        self,
+        vehicle_id: str,
+        command_type: str,
+        max_age_seconds: Optional[int] = None
+    ) -> VehicleData:
+        """Dispatch to the API client refresh strategy for command_type."""
+        # command_type and max_age_seconds are validated by RefreshCommand.parse()
+        if command_type == "smart":
+            return await self.api_client.refresh_smart(vehicle_id, max_age_seconds)
+        return await self._refresh_dispatch[command_type](vehicle_id)
+
+    async def enqueue_command(self, topic: str, payload: bytes) -> None:
         """Add command to processing queue."""
         try:
-            logger.info(f"enqueue_command called with topic={topic}, payload={payload}")
             command = RefreshCommand.parse(topic, payload)
-            logger.debug(f"Command parsed successfully: {command}")
-            await self._command_queue.put(command)
-            logger.info(f"Command enqueued: {command.command_type} for vehicle {command.vehicle_id}")
-            logger.debug(f"Queue size after enqueue: {self._command_queue.qsize()}")
+            key = (command.vehicle_id, command.command_type, command.max_age_seconds)
+            if key in self._pending_refresh_keys:
+                logger.debug(
+                    "Identical %s command already queued for vehicle %s, dropping",
+                    command.command_type, command.vehicle_id
+                )
+                return
+            try:
+                self._command_queue.put_nowait(command)
+            except asyncio.QueueFull:
+                self._dropped_commands += 1
+                if self._dropped_commands % 100 == 1:
+                    logger.warning(
+                        "Command queue full, dropping %s command for vehicle %s (dropped: %d)",
+                        command.command_type, command.vehicle_id, self._dropped_commands
+                    )
+                return
+            self._pending_refresh_keys.add(key)
+            logger.info(
+                "Command enqueued: %s for vehicle %s from %s (queue size: %d)",
+                command.command_type, command.vehicle_id, topic, self._command_queue.qsize()
+            )
         except CommandError as e:
-            logger.error(f"Failed to parse command: {e}")
+            logger.error("Failed to parse command: %s", e)
         except Exception as e:
-            logger.error(f"Failed to enqueue command: {e}", exc_info=True)
+            logger.error("Failed to enqueue command: %s", e, exc_info=True)
 
     async def process_commands(self) -> None:
         """Process commands from queue (main command loop)."""
@@ -365,33 +603,62 @@ class CommandHandler:
         
         while True:
             try:
-                logger.debug("Waiting for command from queue...")
+                # Sample the idle message instead of logging it on every iteration
+                if self._cmd_count % 100 == 0:
+                    logger.debug(
+                        "Waiting for command from queue (%d processed)", self._cmd_count
+                    )
                 command = await self._command_queue.get()
-                logger.info(f"Retrieved command from queue: {command.command_type} for vehicle {command.vehicle_id}")
-                await self.handle_command(command)
-                logger.debug("Command handling completed")
+                
+                # Drain whatever else is already queued so a burst costs one wakeup
+                batch = [command]
+                while True:
+                    try:
+                        batch.append(self._command_queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                
+                for command in batch:
+                    self._pending_refresh_keys.discard(
+                        (command.vehicle_id, command.command_type, command.max_age_seconds)
+                    )
+                    self._cmd_count += 1
+                    logger.info(
+                        "Retrieved command from queue: %s for vehicle %s",
+                        command.command_type, command.vehicle_id
+                    )
+                    await self.handle_command(command)
             except asyncio.CancelledError:
                 logger.info("Command processing loop cancelled")
                 raise
             except Exception as e:
-                logger.error(f"Error processing command: {e}", exc_info=True)
+                logger.error("Error processing command: %s", e, exc_info=True)
 
     # ===== Control Command Methods =====
 
-    async def enqueue_control_command(self, topic: str, payload: str) -> None:
+    async def enqueue_control_command(self, topic: str, payload: bytes) -> None:
         """Add control command to processing queue."""
         try:
-            logger.info(f"enqueue_control_command called with topic={topic}, payload={payload}")
+            logger.info("enqueue_control_command called with topic=%s, payload=%r", topic, payload)
             command = ControlCommand.parse(topic, payload, self.mqtt_client.topic_manager)
-            logger.debug(f"Control command parsed successfully: {command}")
-            await self._control_command_queue.put(command)
-            logger.info(f"Control command enqueued: {command.command_type} for vehicle {command.vehicle_id}")
+            logger.debug("Control command parsed successfully: %s", command)
+            try:
+                self._control_command_queue.put_nowait(command)
+            except asyncio.QueueFull:
+                self._dropped_control_commands += 1
+                if self._dropped_control_commands % 100 == 1:
+                    logger.warning(
+                        "Control command queue full, dropping %s command for vehicle %s (dropped: %d)",
+                        command.command_type, command.vehicle_id, self._dropped_control_commands
+                    )
+                return
+            logger.info("Control command enqueued: %s for vehicle %s", command.command_type, command.vehicle_id)
         except CommandError as e:
-            logger.error(f"Failed to parse control command: {e}")
+            logger.error("Failed to parse control command: %s", e)
         except Exception as e:
-            logger.error(f"Failed to enqueue control command: {e}", exc_info=True)
+            logger.error("Failed to enqueue control command: %s", e, exc_info=True)
 
-    async def handle_control_command(self, command: ControlCommand) -> None:
+    async def handle_control_command(self, command: AnyControlCommand) -> None:
         """
         Execute control command with confirmation pattern.
         
@@ -405,21 +672,28 @@ class CommandHandler:
         """
         vehicle_id = command.vehicle_id
         try:
-            logger.info(f"Executing {command.command_type} control command for vehicle {vehicle_id}")
+            logger.info("Executing %s control command for vehicle %s", command.command_type, vehicle_id)
             
             # Execute command and get action_id
             action_id = await self._execute_command(command)
             
-            # Create action tracker
-            request_id = f"{vehicle_id}_{command.command_type}_{int(datetime.utcnow().timestamp())}"
+            # Create action tracker; the random request_id suffix keeps
+            # same-second commands for a vehicle from colliding
+            request_id = f"{vehicle_id}_{command.command_type}_{uuid.uuid4().hex[:12]}"
             tracker = ActionTracker(
                 action_id=action_id,
                 request_id=request_id,
                 command_type=command.command_type,
                 vehicle_id=vehicle_id,
-                started_at=datetime.utcnow(),
+                started_at=time.time_ns(),
+                timeout_seconds=command.timeout_seconds,
                 last_status="PENDING"
             )
+            if len(self._active_actions) >= self._max_active_actions:
+                evicted_id, _ = self._active_actions.popitem(last=False)
+                logger.warning(
+                    "Active action limit reached, no longer tracking action %s", evicted_id
+                )
             self._active_actions[action_id] = tracker
             
             # Publish initial status
@@ -428,11 +702,12 @@ class CommandHandler:
             # Start status polling task (non-blocking)
             asyncio.create_task(self._poll_action_status(tracker))
             
-            logger.info(f"Control command initiated with action_id: {action_id}")
+            logger.info("Control command initiated with action_id: %s", action_id)
             
         except Exception as e:
-            logger.error(f"Control command execution failed for vehicle {vehicle_id}: {e}")
+            logger.error("Control command execution failed for vehicle %s: %s", vehicle_id, e)
             # Publish error status
+            self._mark_error(vehicle_id, True)
             try:
                 await self.mqtt_client.publish_error_status(
                     vehicle_id,
@@ -440,73 +715,66 @@ class CommandHandler:
                         "error": str(e),
                         "error_type": type(e).__name__,
                         "command_type": command.command_type,
-                        "timestamp": datetime.utcnow().isoformat() + "Z"
+                        "timestamp": datetime.utcnow()  # formatted by json_dumps
                     }
                 )
             except Exception as pub_error:
-                logger.error(f"Failed to publish error status: {pub_error}")
+                logger.error("Failed to publish error status: %s", pub_error)
 
-    async def _execute_command(self, command: ControlCommand) -> str:
+    async def _execute_command(self, command: AnyControlCommand) -> str:
         """
         Execute specific control command and return action_id.
         
         Dispatches to appropriate API client method based on command type.
         """
-        vehicle_id = command.vehicle_id
-        
-        if command.command_type == "lock":
-            lock_cmd = LockCommand.from_control_command(command)
-            if lock_cmd.action == "lock":
-                return await self.api_client.lock_vehicle(vehicle_id)
-            else:
-                return await self.api_client.unlock_vehicle(vehicle_id)
-        
-        elif command.command_type == "climate":
-            climate_cmd = ClimateCommand.from_control_command(command)
-            if climate_cmd.action == "start_climate":
-                # Create climate options from command
-                options = self._create_climate_options(climate_cmd)
-                return await self.api_client.start_climate(vehicle_id, options)
-            else:
-                return await self.api_client.stop_climate(vehicle_id)
-        
-        elif command.command_type == "windows":
-            windows_cmd = WindowsCommand.from_control_command(command)
-            options = self._create_windows_options(windows_cmd)
-            return await self.api_client.set_windows_state(vehicle_id, options)
-        
-        elif command.command_type == "charge_port":
-            charge_cmd = ChargePortCommand.from_control_command(command)
-            if charge_cmd.action == "open":
-                return await self.api_client.open_charge_port(vehicle_id)
-            else:
-                return await self.api_client.close_charge_port(vehicle_id)
-        
-        elif command.command_type == "charging_current":
-            current_cmd = ChargingCurrentCommand.from_control_command(command)
-            return await self.api_client.set_charging_current(vehicle_id, current_cmd.level)
-        
-        else:
+        handler = self._control_dispatch.get(command.command_type)
+        if handler is None:
             raise CommandError(f"Unknown command type: {command.command_type}")
+        return await handler(command)
+
+    async def _do_lock(self, command: LockCommand) -> str:
+        """Lock or unlock the vehicle."""
+        if command.action == "lock":
+            return await self.api_client.lock_vehicle(command.vehicle_id)
+        return await self.api_client.unlock_vehicle(command.vehicle_id)
+
+    async def _do_climate(self, command: ClimateCommand) -> str:
+        """Start or stop climate control."""
+        if command.action == "start_climate":
+            # Create climate options from command
+            options = self._create_climate_options(command)
+            return await self.api_client.start_climate(command.vehicle_id, options)
+        return await self.api_client.stop_climate(command.vehicle_id)
+
+    async def _do_windows(self, command: WindowsCommand) -> str:
+        """Set window states."""
+        options = self._create_windows_options(command)
+        return await self.api_client.set_windows_state(command.vehicle_id, options)
+
+    async def _do_charge_port(self, command: ChargePortCommand) -> str:
+        """Open or close the charge port."""
+        if command.action == "open":
+            return await self.api_client.open_charge_port(command.vehicle_id)
+        return await self.api_client.close_charge_port(command.vehicle_id)
+
+    async def _do_charging_current(self, command: ChargingCurrentCommand) -> str:
+        """Set the AC charging current limit (EU-only)."""
+        return await self.api_client.set_charging_current(command.vehicle_id, command.level)
 
     async def _poll_action_status(self, tracker: ActionTracker) -> None:
         """
-        Wait for action completion using upstream API's built-in polling.
+        Wait for action completion using the API client's status polling.
         
-        The upstream API handles all polling internally when synchronous=True.
+        The API client polls with backoff when synchronous=True.
         We just wait for the final result and refresh vehicle data if successful.
         """
-        from ..hyundai.api_client import EU_COMMAND_TIMEOUTS
-        
-        timeout = EU_COMMAND_TIMEOUTS.get(tracker.command_type, 60)
-        
         try:
-            # Let the upstream API handle all the polling
+            # Let the API client handle all the polling
             final_status = await self.api_client.check_action_status(
                 tracker.vehicle_id,
                 tracker.action_id,
-                synchronous=True,  # API polls internally until terminal state
-                timeout_seconds=timeout
+                synchronous=True,  # Client polls until terminal state or timeout
+                timeout_seconds=tracker.timeout_seconds
             )
             
             # Update tracker with final status
@@ -518,22 +786,21 @@ class CommandHandler:
             # If successful, refresh vehicle data to get updated state
             if final_status == "SUCCESS":
                 try:
-                    data = await self.api_client.refresh_force(tracker.vehicle_id)
+                    data = await self._refresh(tracker.vehicle_id, "force")
                     await self.mqtt_client.publish_vehicle_data(data)
                 except Exception as refresh_error:
-                    logger.warning(f"Failed to refresh after successful command: {refresh_error}")
+                    logger.warning("Failed to refresh after successful command: %s", refresh_error)
             
-            logger.info(f"Action {tracker.action_id} completed with status: {final_status}")
+            logger.info("Action %s completed with status: %s", tracker.action_id, final_status)
             
         except Exception as e:
-            logger.error(f"Action status check failed for {tracker.action_id}: {e}")
+            logger.error("Action status check failed for %s: %s", tracker.action_id, e)
             tracker.update_status("FAILED", str(e))
             await self._publish_action_status(tracker, "FAILED", str(e))
         
         finally:
             # Cleanup tracker
-            if tracker.action_id in self._active_actions:
-                del self._active_actions[tracker.action_id]
+            self._active_actions.pop(tracker.action_id, None)
 
     async def _publish_action_status(
         self,
@@ -543,73 +810,54 @@ class CommandHandler:
     ) -> None:
         """Publish action status to MQTT action confirmation topics."""
         topic_manager = self.mqtt_client.topic_manager
-        
-        # Publish status
-        status_topic = topic_manager.action_status_topic(tracker.vehicle_id, tracker.action_id)
-        await self.mqtt_client.publish(status_topic, status, qos=1, retain=False)
-        
-        # Publish started_at timestamp
-        if tracker.started_at:
-            started_topic = topic_manager.action_started_topic(tracker.vehicle_id, tracker.action_id)
-            await self.mqtt_client.publish(
-                started_topic,
-                tracker.started_at.isoformat() + "Z",
-                qos=1,
-                retain=False
+        vehicle_id, action_id = tracker.vehicle_id, tracker.action_id
+        
+        # Status and start time, plus completion time and error when present, sent as one batch
+        messages = [
+            (topic_manager.action_status_topic(vehicle_id, action_id), status, 1, False),
+            (topic_manager.action_started_topic(vehicle_id, action_id), tracker.started_at_iso, 1, False),
+        ]
+        if tracker.completed_at is not None:
+            messages.append(
+                (topic_manager.action_completed_topic(vehicle_id, action_id), tracker.completed_at_iso, 1, False)
             )
-        
-        # Publish completed_at timestamp if completed
-        if tracker.completed_at:
-            completed_topic = topic_manager.action_completed_topic(tracker.vehicle_id, tracker.action_id)
-            await self.mqtt_client.publish(
-                completed_topic,
-                tracker.completed_at.isoformat() + "Z",
-                qos=1,
-                retain=False
-            )
-        
-        # Publish error if present
         if error:
-            error_topic = topic_manager.action_error_topic(tracker.vehicle_id, tracker.action_id)
-            await self.mqtt_client.publish(error_topic, error, qos=1, retain=False)
+            messages.append((topic_manager.action_error_topic(vehicle_id, action_id), error, 1, False))
         
-        logger.debug(f"Published action status: {status} for action {tracker.action_id}")
+        await self.mqtt_client.publish_batch(messages)
+        
+        logger.debug("Published action status: %s for action %s", status, tracker.action_id)
 
     def _create_climate_options(self, cmd: ClimateCommand) -> Dict[str, Any]:
         """Create climate options dictionary from ClimateCommand."""
-        options = {}
-        if cmd.set_temp is not None:
-            options["set_temp"] = cmd.set_temp
-        if cmd.duration is not None:
-            options["duration"] = cmd.duration
-        if cmd.defrost is not None:
-            options["defrost"] = cmd.defrost
-        if cmd.climate is not None:
-            options["climate"] = cmd.climate
-        if cmd.steering_wheel is not None:
-            options["steering_wheel"] = cmd.steering_wheel
-        if cmd.front_left_seat is not None:
-            options["front_left_seat"] = cmd.front_left_seat
-        if cmd.front_right_seat is not None:
-            options["front_right_seat"] = cmd.front_right_seat
-        if cmd.rear_left_seat is not None:
-            options["rear_left_seat"] = cmd.rear_left_seat
-        if cmd.rear_right_seat is not None:
-            options["rear_right_seat"] = cmd.rear_right_seat
-        return options
+        return {
+            key: value
+            for key, value in (
+                ("set_temp", cmd.set_temp),
+                ("duration", cmd.duration),
+                ("defrost", cmd.defrost),
+                ("climate", cmd.climate),
+                ("steering_wheel", cmd.steering_wheel),
+                ("front_left_seat", cmd.front_left_seat),
+                ("front_right_seat", cmd.front_right_seat),
+                ("rear_left_seat", cmd.rear_left_seat),
+                ("rear_right_seat", cmd.rear_right_seat),
+            )
+            if value is not None
+        }
 
     def _create_windows_options(self, cmd: WindowsCommand) -> Dict[str, Any]:
         """Create windows options dictionary from WindowsCommand."""
-        options = {}
-        if cmd.front_left is not None:
-            options["front_left"] = cmd.front_left
-        if cmd.front_right is not None:
-            options["front_right"] = cmd.front_right
-        if cmd.back_left is not None:
-            options["back_left"] = cmd.back_left
-        if cmd.back_right is not None:
-            options["back_right"] = cmd.back_right
-        return options
+        return {
+            key: value
+            for key, value in (
+                ("front_left", cmd.front_left),
+                ("front_right", cmd.front_right),
+                ("back_left", cmd.back_left),
+                ("back_right", cmd.back_right),
+            )
+            if value is not None
+        }
 
     async def process_control_commands(self) -> None:
         """Process control commands from queue (main control command loop)."""
@@ -619,11 +867,11 @@ class CommandHandler:
             try:
                 logger.debug("Waiting for control command from queue...")
                 command = await self._control_command_queue.get()
-                logger.info(f"Retrieved control command from queue: {command.command_type} for vehicle {command.vehicle_id}")
+                logger.info("Retrieved control command from queue: %s for vehicle %s", command.command_type, command.vehicle_id)
                 await self.handle_control_command(command)
                 logger.debug("Control command handling completed")
             except asyncio.CancelledError:
                 logger.info("Control command processing loop cancelled")
                 raise
             except Exception as e:
-                logger.error(f"Error processing control command: {e}", exc_info=True)
+                logger.error("Error processing control command: %s", e, exc_info=True)
@@ -1,5 +1,5 @@
 """Configuration management for Hyundai MQTT integration."""
 
-from .settings import AppConfig, HyundaiConfig, MQTTConfig, load_config
+from .settings import AppConfig, HyundaiConfig, MQTTConfig, load_config, reload_config
 
-__all__ = ["AppConfig", "HyundaiConfig", "MQTTConfig", "load_config"]
+__all__ = ["AppConfig", "HyundaiConfig", "MQTTConfig", "load_config", "reload_config"]
@@ -2,71 +2,159 @@
 
 import os
 from dataclasses import dataclass
-from enum import IntEnum
-from typing import Optional
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 
+from ..utils.errors import ConfigurationError
 
-class Region(IntEnum):
-    """Supported regions from hyundai_kia_connect_api."""
-    EUROPE = 1
-    CANADA = 2
-    USA = 3
-    CHINA = 4
-    AUSTRALIA = 5
-    INDIA = 6
-    NEW_ZEALAND = 7
-    BRAZIL = 8
 
+# Optional env file, relative to the working directory
+_DOTENV_PATH = ".env"
 
-class Brand(IntEnum):
-    """Supported brands."""
-    HYUNDAI = 1
-    KIA = 2
-    GENESIS = 3
+# Region and brand codes from hyundai_kia_connect_api. Config keeps the raw
+# ints (what VehicleManager takes); these maps are only for validation/logging.
+REGION_NAMES: Mapping[int, str] = MappingProxyType({
+    1: "EUROPE",
+    2: "CANADA",
+    3: "USA",
+    4: "CHINA",
+    5: "AUSTRALIA",
+    6: "INDIA",
+    7: "NEW_ZEALAND",
+    8: "BRAZIL",
+})
 
+BRAND_NAMES: Mapping[int, str] = MappingProxyType({
+    1: "HYUNDAI",
+    2: "KIA",
+    3: "GENESIS",
+})
 
-@dataclass
+# Accepted (lowercased) spellings for boolean env vars; anything else is an error
+_TRUTHY = frozenset(("true", "1", "yes", "on"))
+_FALSY = frozenset(("false", "0", "no", "off", ""))
+_BOOL_MAP: Mapping[str, bool] = MappingProxyType(
+    {**dict.fromkeys(_FALSY, False), **dict.fromkeys(_TRUTHY, True)}
+)
+
+# Canonical log level names, returned as-is to skip the upper() copy
+_LOG_LEVELS = frozenset(("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"))
+
+
+def _non_empty(raw: str) -> str:
+    """Return raw, rejecting the empty string."""
+    if not raw:
+        raise ValueError(raw)
+    return raw
+
+
+def _int_in(allowed: Callable[[int], bool]) -> Callable[[str], int]:
+    """Build a converter parsing an int and rejecting values allowed() refuses."""
+    def convert(raw: str) -> int:
+        value = int(raw)
+        if not allowed(value):
+            raise ValueError(raw)
+        return value
+    return convert
+
+
+def _bool(raw: str) -> bool:
+    """Parse a boolean spelling from _BOOL_MAP, rejecting anything else."""
+    # Try the raw string first; only normalise non-canonical spellings
+    value = _BOOL_MAP.get(raw)
+    if value is None:
+        value = _BOOL_MAP.get(raw.strip().lower())
+    if value is None:
+        raise ValueError(raw)
+    return value
+
+
+# Env schema: name -> (default, converter, expectation). A default of None
+# marks the variable as required; converters raise ValueError on bad input.
+# This is the single source of truth for parsing and validating these values.
+_SCHEMA: Mapping[str, Tuple[Optional[str], Callable[[str], Any], str]] = MappingProxyType({
+    "HYUNDAI_USERNAME": (None, _non_empty, "a non-empty value"),
+    "HYUNDAI_PASSWORD": (None, _non_empty, "a non-empty value"),
+    "HYUNDAI_PIN": (None, _non_empty, "a non-empty value"),
+    "HYUNDAI_REGION": ("1", _int_in(REGION_NAMES.__contains__), f"one of {sorted(REGION_NAMES)}"),
+    "HYUNDAI_BRAND": ("1", _int_in(BRAND_NAMES.__contains__), f"one of {sorted(BRAND_NAMES)}"),
+    "HYUNDAI_API_THREAD_WORKERS": ("16", _int_in(lambda v: v > 0), "a positive integer"),
+    "HYUNDAI_ALLOW_STALE": ("false", _bool, "a boolean"),
+    "MQTT_BROKER_PORT": ("1883", _int_in(lambda v: 0 < v < 65536), "a port between 1 and 65535"),
+    "MQTT_QOS": ("1", _int_in(lambda v: 0 <= v <= 2), "0, 1 or 2"),
+    "MQTT_USE_TLS": ("false", _bool, "a boolean"),
+    "INITIAL_REFRESH": ("true", _bool, "a boolean"),
+})
+
+_HYUNDAI_VARS = tuple(name for name in _SCHEMA if name.startswith("HYUNDAI_"))
+_MQTT_VARS = tuple(name for name in _SCHEMA if name.startswith("MQTT_"))
+
+
+def _parse_env(env: Mapping[str, str], names: Iterable[str] = _SCHEMA) -> Dict[str, Any]:
+    """
+    Convert the named _SCHEMA variables from env in one pass.
+
+    Returns the converted values keyed by variable name; raises a single
+    ConfigurationError listing every missing or invalid variable.
+    """
+    values: Dict[str, Any] = {}
+    errors = []
+    for name in names:
+        default, convert, expected = _SCHEMA[name]
+        raw = env.get(name, default)
+        if raw is None:
+            errors.append(f"{name} is required")
+            continue
+        try:
+            values[name] = convert(raw)
+        except ValueError:
+            errors.append(f"{name}={raw!r} is invalid, expected {expected}")
+    if errors:
+        raise ConfigurationError("Invalid configuration:\n" + "\n".join(errors))
+    return values
+
+
+def _validate_env(env: Mapping[str, str]) -> None:
+    """Check every _SCHEMA entry and report all problems together."""
+    _parse_env(env)
+
+
+@dataclass(slots=True, frozen=True)
 class HyundaiConfig:
     """Hyundai API configuration."""
     username: str
     password: str
     pin: str
-    region: Region
-    brand: Brand
+    region: int  # Key of REGION_NAMES
+    brand: int  # Key of BRAND_NAMES
     vehicle_id: Optional[str] = None
+    api_thread_workers: int = 16  # Size of the blocking vendor-call thread pool
+    allow_stale: bool = False  # Serve last-known-good data when a refresh fails
 
     @staticmethod
-    def from_env() -> 'HyundaiConfig':
-        """Load from environment variables with validation."""
-        from ..utils.errors import ConfigurationError
-        
-        username = os.getenv("HYUNDAI_USERNAME")
-        password = os.getenv("HYUNDAI_PASSWORD")
-        pin = os.getenv("HYUNDAI_PIN")
+    def from_env(env: Optional[Mapping[str, str]] = None) -> 'HyundaiConfig':
+        """Load from environment variables (or an env snapshot) with validation."""
+        if env is None:
+            env = os.environ
         
-        # Validate required fields
-        if not all([username, password, pin]):
-            raise ConfigurationError("Missing required Hyundai credentials (HYUNDAI_USERNAME, HYUNDAI_PASSWORD, HYUNDAI_PIN)")
-        
-        try:
-            region = Region(int(os.getenv("HYUNDAI_REGION", "1")))
-            brand = Brand(int(os.getenv("HYUNDAI_BRAND", "1")))
-        except (ValueError, KeyError) as e:
-            raise ConfigurationError(f"Invalid region or brand configuration: {e}")
+        values = _parse_env(env, _HYUNDAI_VARS)
         
         return HyundaiConfig(
-            username=username,  # type: ignore
-            password=password,  # type: ignore
-            pin=pin,  # type: ignore
-            region=region,
-            brand=brand,
-            vehicle_id=os.getenv("HYUNDAI_VEHICLE_ID")
+            username=values["HYUNDAI_USERNAME"],
+            password=values["HYUNDAI_PASSWORD"],
+            pin=values["HYUNDAI_PIN"],
+            region=values["HYUNDAI_REGION"],
+            brand=values["HYUNDAI_BRAND"],
+            vehicle_id=env.get("HYUNDAI_VEHICLE_ID"),
+            api_thread_workers=values["HYUNDAI_API_THREAD_WORKERS"],
+            allow_stale=values["HYUNDAI_ALLOW_STALE"],
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MQTTConfig:
     """MQTT broker configuration."""
     broker_host: str
@@ -79,59 +167,104 @@ class MQTTConfig:
     base_topic: str
 
     @staticmethod
-    def from_env() -> 'MQTTConfig':
-        """Load from environment variables with validation."""
-        from ..utils.errors import ConfigurationError
+    def from_env(env: Optional[Mapping[str, str]] = None) -> 'MQTTConfig':
+        """Load from environment variables (or an env snapshot) with validation."""
+        if env is None:
+            env = os.environ
         
-        broker_host = os.getenv("MQTT_BROKER_HOST", "localhost")
-        
-        try:
-            broker_port = int(os.getenv("MQTT_BROKER_PORT", "1883"))
-            qos_level = int(os.getenv("MQTT_QOS", "1"))
-        except ValueError as e:
-            raise ConfigurationError(f"Invalid MQTT port or QoS configuration: {e}")
-        
-        use_tls_str = os.getenv("MQTT_USE_TLS", "false").lower()
-        use_tls = use_tls_str in ("true", "1", "yes")
+        values = _parse_env(env, _MQTT_VARS)
         
         return MQTTConfig(
-            broker_host=broker_host,
-            broker_port=broker_port,
-            username=os.getenv("MQTT_USERNAME"),
-            password=os.getenv("MQTT_PASSWORD"),
-            use_tls=use_tls,
-            client_id=os.getenv("MQTT_CLIENT_ID", "hyundai_mqtt"),
-            qos_level=qos_level,
-            base_topic=os.getenv("MQTT_BASE_TOPIC", "hyundai")
+            broker_host=env.get("MQTT_BROKER_HOST", "localhost"),
+            broker_port=values["MQTT_BROKER_PORT"],
+            username=env.get("MQTT_USERNAME"),
+            password=env.get("MQTT_PASSWORD"),
+            use_tls=values["MQTT_USE_TLS"],
+            client_id=env.get("MQTT_CLIENT_ID", "hyundai_mqtt"),
+            qos_level=values["MQTT_QOS"],
+            base_topic=env.get("MQTT_BASE_TOPIC", "hyundai")
         )
 
 
-@dataclass
 class AppConfig:
-    """Complete application configuration."""
-    hyundai: HyundaiConfig
-    mqtt: MQTTConfig
-    log_level: str
-    initial_refresh: bool
+    """
+    Complete application configuration.
+    
+    The hyundai and mqtt sections are parsed from the env snapshot on first
+    access, so callers that only need one of them never parse the other.
+    """
+
+    def __init__(self, env: Mapping[str, str], log_level: str, initial_refresh: bool) -> None:
+        self._env: Mapping[str, str] = env
+        self.log_level: str = log_level
+        self.initial_refresh: bool = initial_refresh
+
+    @cached_property
+    def hyundai(self) -> HyundaiConfig:
+        """Hyundai API configuration, loaded on first access."""
+        return HyundaiConfig.from_env(self._env)
+
+    @cached_property
+    def mqtt(self) -> MQTTConfig:
+        """MQTT broker configuration, loaded on first access."""
+        return MQTTConfig.from_env(self._env)
 
     @staticmethod
-    def from_env() -> 'AppConfig':
-        """Load complete configuration from environment."""
-        initial_refresh_str = os.getenv("INITIAL_REFRESH", "true").lower()
-        initial_refresh = initial_refresh_str in ("true", "1", "yes")
+    def from_env(env: Optional[Mapping[str, str]] = None) -> 'AppConfig':
+        """Load complete configuration from environment (or an env snapshot)."""
+        if env is None:
+            # Snapshot, since the sections are parsed lazily
+            env = dict(os.environ)
+        
+        initial_refresh = _parse_env(env, ("INITIAL_REFRESH",))["INITIAL_REFRESH"]
+        log_level = env.get("LOG_LEVEL", "INFO")
+        if log_level not in _LOG_LEVELS:
+            log_level = log_level.upper()
         
         return AppConfig(
-            hyundai=HyundaiConfig.from_env(),
-            mqtt=MQTTConfig.from_env(),
-            log_level=os.getenv("LOG_LEVEL", "INFO").upper(),
+            env=env,
+            log_level=log_level,
             initial_refresh=initial_refresh
         )
 
 
+@lru_cache(maxsize=1)
 def load_config() -> AppConfig:
-    """Load configuration from .env file and environment variables."""
-    # Load .env file if it exists
-    load_dotenv()
+    """
+    Load configuration from .env file and environment variables.
+    
+    The result is cached for the life of the process; call reload_config()
+    to re-read the .env file and environment.
+    """
+    # Read ./.env (if present). The explicit path skips find_dotenv()'s
+    # directory walk, and container deployments without the file never touch
+    # dotenv at all. Keys without a value parse as None and are skipped.
+    env: Dict[str, str] = {}
+    if os.path.isfile(_DOTENV_PATH):
+        env = {
+            key: value
+            for key, value in dotenv_values(_DOTENV_PATH).items()
+            if value is not None
+        }
+        # Export to the process environment without overriding it, as
+        # load_dotenv(override=False) does: the vendor library and requests
+        # read settings such as HTTPS_PROXY and REQUESTS_CA_BUNDLE from there
+        for key, value in env.items():
+            os.environ.setdefault(key, value)
+    
+    # Overlay a single snapshot of the process environment, which takes
+    # precedence over .env. from_env() then reads a plain dict instead of
+    # going through os.environ's key/value encoding on every lookup.
+    env.update(os.environ)
+    
+    # Fail fast on every invalid setting, even though sections load lazily
+    _validate_env(env)
     
     # Load and return configuration
-    return AppConfig.from_env()
+    return AppConfig.from_env(env)
+
+
+def reload_config() -> AppConfig:
+    """Discard the cached configuration and load it again."""
+    load_config.cache_clear()
+    return load_config()
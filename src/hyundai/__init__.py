@@ -1,12 +1,38 @@
 """Hyundai API integration layer."""
 
-from .api_client import HyundaiAPIClient
-from .data_mapper import BatteryData, EVData, StatusData, VehicleData
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict
 
-__all__ = [
+if TYPE_CHECKING:
+    from .api_client import HyundaiAPIClient
+    from .data_mapper import BatteryData, EVData, StatusData, VehicleData
+
+__all__ = (
     "HyundaiAPIClient",
     "BatteryData",
     "EVData",
     "StatusData",
     "VehicleData",
-]
+)
+
+# Submodule providing each public name, imported on first attribute access (PEP 562)
+_LAZY_IMPORTS: Dict[str, str] = {
+    "HyundaiAPIClient": ".api_client",
+    "BatteryData": ".data_mapper",
+    "EVData": ".data_mapper",
+    "StatusData": ".data_mapper",
+    "VehicleData": ".data_mapper",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
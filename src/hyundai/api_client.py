@@ -1,22 +1,35 @@
 """Hyundai API client wrapper with refresh strategies."""
 
 import asyncio
-from datetime import datetime, timedelta
-from typing import Any, Callable, List, Optional
+import logging
+import random
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from enum import IntEnum
+from functools import lru_cache
+from itertools import chain, repeat
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple, Type, TypeVar
 
 from hyundai_kia_connect_api import VehicleManager, ClimateRequestOptions, WindowRequestOptions
 from hyundai_kia_connect_api.ApiImpl import ORDER_STATUS
+from hyundai_kia_connect_api.exceptions import AuthenticationError, HyundaiKiaException
 
-from ..config.settings import HyundaiConfig
-from ..utils.errors import HyundaiAPIError, RefreshError
+from ..config.settings import BRAND_NAMES, REGION_NAMES, HyundaiConfig
+from ..utils.errors import HyundaiAPIError, HyundaiMQTTError, RefreshError
 from ..utils.logger import get_logger
 from .data_mapper import VehicleData, map_vehicle_data
 
 logger = get_logger(__name__)
 
+_T = TypeVar("_T")
 
-# EU-specific timeout configurations per command type (seconds)
-EU_COMMAND_TIMEOUTS = {
+
+# EU-specific timeout configurations per command type (seconds); read-only
+EU_COMMAND_TIMEOUTS: Mapping[str, int] = MappingProxyType({
     "lock": 60,
     "unlock": 60,
     "climate_start": 120,
@@ -25,35 +38,129 @@ EU_COMMAND_TIMEOUTS = {
     "windows": 90,
     "charge_port": 60,
     "charging_current": 120,  # EU-only feature
-}
+})
+
+# Lowercased error-message fragments that indicate an expired or rejected token.
+# "token is expired" also covers "key not authorized: token is expired".
+_TOKEN_EXPIRED_KEYWORDS: Tuple[str, ...] = (
+    "token is expired",
+    "authentication failed",
+    "unauthorized",
+)
+
+# Option fields forwarded from command payloads to the vendor request options
+_CLIMATE_OPTION_FIELDS: Tuple[str, ...] = (
+    "set_temp",
+    "duration",
+    "defrost",
+    "climate",
+    "steering_wheel",
+    "front_left_seat",
+    "front_right_seat",
+    "rear_left_seat",
+    "rear_right_seat",
+)
+_WINDOW_OPTION_FIELDS: Tuple[str, ...] = ("front_left", "front_right", "back_left", "back_right")
+
+# Failures of a vendor call that are retried/recorded on the circuit breaker:
+# vendor and network errors (requests' exceptions derive from OSError), the
+# KeyError/ValueError the vendor raises while parsing API responses, and
+# NotImplementedError for operations a region does not support. Anything else
+# (TypeError, AttributeError, ...) is a bug and propagates unwrapped.
+_API_ERRORS: Tuple[Type[BaseException], ...] = (
+    HyundaiKiaException,
+    OSError,
+    asyncio.TimeoutError,
+    KeyError,
+    ValueError,
+    NotImplementedError,
+)
+
+_MAX_VEHICLE_LOCKS = 256
+# Delays (seconds) between synchronous action-status polls; the last repeats
+_STATUS_POLL_DELAYS: Tuple[float, ...] = (1.0, 2.0, 3.0, 5.0)
+_CACHED_REFRESH_TTL = 5.0  # Seconds a refresh_cached result is served from memory
+# Token-expired retries per vendor call; retries after the first back off, capped
+_MAX_TOKEN_RETRIES = 2
+_TOKEN_RETRY_MAX_DELAY = 30.0
+
+
+# Canonical status per known status token. Insertion order is the precedence
+# for the substring fallback (success markers before failure markers).
+_STATUS_MAP: Mapping[str, str] = MappingProxyType({
+    "SUCCESS": "SUCCESS",
+    "COMPLETE": "SUCCESS",
+    "COMPLETED": "SUCCESS",
+    "FAIL": "FAILED",
+    "FAILED": "FAILED",
+    "ERROR": "FAILED",
+    "PENDING": "PENDING",
+    "PROCESSING": "PENDING",
+    "IN_PROGRESS": "PENDING",
+    "TIMEOUT": "TIMEOUT",
+})
+
+
+@lru_cache(maxsize=64)
+def _classify_status_string(status: str) -> str:
+    """Map a free-form action status string to a canonical status (memoized)."""
+    token = status.strip().upper()
+    canonical = _STATUS_MAP.get(token)
+    if canonical is not None:
+        return canonical
+    # Partial match, e.g. "REQUEST COMPLETED"
+    for marker, canonical in _STATUS_MAP.items():
+        if marker in token:
+            return canonical
+    return "UNKNOWN"
+
+
+class _CBState(IntEnum):
+    """Circuit breaker states."""
+    CLOSED = 0
+    OPEN = 1
+    HALF_OPEN = 2
 
 
 class CircuitBreaker:
     """
     Prevents repeated API calls when service is down.
     States: CLOSED (normal) -> OPEN (failing) -> HALF_OPEN (testing)
+    Each re-open without an intervening success doubles the OPEN duration
+    (capped at max_timeout, with +/-20% jitter).
     """
 
-    def __init__(self, failure_threshold: int = 5, timeout: int = 60) -> None:
+    __slots__ = (
+        "failure_threshold",
+        "timeout",
+        "max_timeout",
+        "current_timeout",
+        "open_cycles",
+        "failure_count",
+        "state",
+        "_last_failure_monotonic",
+    )
+
+    def __init__(self, failure_threshold: int = 5, timeout: int = 60, max_timeout: int = 900) -> None:
         self.failure_threshold: int = failure_threshold
-        self.timeout: int = timeout
+        self.timeout: int = timeout  # Base OPEN duration, doubled per consecutive re-open
+        self.max_timeout: int = max_timeout
+        self.current_timeout: float = float(timeout)
+        self.open_cycles: int = 0  # OPEN transitions since the last success
         self.failure_count: int = 0
-        self.state: str = "CLOSED"
-        self.last_failure_time: Optional[datetime] = None
+        self.state: _CBState = _CBState.CLOSED
+        # time.monotonic() of the most recent failure (immune to wall-clock steps)
+        self._last_failure_monotonic: float = 0.0
 
     def can_execute(self) -> bool:
         """Check if circuit allows execution."""
-        if self.state == "CLOSED":
+        if self.state is _CBState.CLOSED:
             return True
 
-        if self.state == "OPEN":
+        if self.state is _CBState.OPEN:
             # Check if timeout has elapsed
-            if (
-                self.last_failure_time
-                and datetime.utcnow() - self.last_failure_time
-                > timedelta(seconds=self.timeout)
-            ):
-                self.state = "HALF_OPEN"
+            if time.monotonic() - self._last_failure_monotonic > self.current_timeout:
+                self.state = _CBState.HALF_OPEN
                 logger.info("Circuit breaker entering HALF_OPEN state")
                 return True
             return False
@@ -63,20 +170,28 @@ class CircuitBreaker:
 
     def record_success(self) -> None:
         """Record successful execution."""
-        if self.state == "HALF_OPEN":
+        # Common case: already CLOSED, so only the counter reset runs
+        if self.state is not _CBState.CLOSED:
             logger.info("Circuit breaker closing after successful execution")
+            self.state = _CBState.CLOSED
         self.failure_count = 0
-        self.state = "CLOSED"
+        self.open_cycles = 0
 
     def record_failure(self) -> None:
         """Record failed execution."""
         self.failure_count += 1
-        self.last_failure_time = datetime.utcnow()
-
-        if self.failure_count >= self.failure_threshold:
-            self.state = "OPEN"
+        self._last_failure_monotonic = time.monotonic()
+
+        if self.failure_count >= self.failure_threshold and self.state is not _CBState.OPEN:
+            # Exponential backoff across re-opens, jittered to avoid synchronized retries
+            backoff = min(self.max_timeout, self.timeout * 2 ** min(self.open_cycles, 16))
+            self.current_timeout = backoff * random.uniform(0.8, 1.2)
+            self.open_cycles += 1
+            self.state = _CBState.OPEN
             logger.warning(
-                f"Circuit breaker opened after {self.failure_count} failures"
+                "Circuit breaker opened after %d failures, retrying in %.0fs",
+                self.failure_count,
+                self.current_timeout,
             )
 
 
@@ -91,59 +206,177 @@ class HyundaiAPIClient:
         self.vehicle_manager: Optional[VehicleManager] = None
         self.circuit_breaker: CircuitBreaker = CircuitBreaker()
         self._token_refresh_lock: asyncio.Lock = asyncio.Lock()
-        self._last_refresh_time: Optional[datetime] = None
+        # time.monotonic() of the last successful token refresh
+        self._last_refresh_monotonic: Optional[float] = None
+        self._token_refresh_interval: float = 30.0  # Skip refreshes within this window
+        # Vehicle IDs resolved once at discovery (initialize)
+        self._vehicle_ids_cache: Optional[List[str]] = None
+        # Last refresh_cached result per vehicle: (time.monotonic(), data)
+        self._cached_data: Dict[str, Tuple[float, VehicleData]] = {}
+        # Most recent successfully mapped data per vehicle, for stale fallback
+        self._last_good: Dict[str, VehicleData] = {}
+        # In-flight refreshes and status checks keyed by (kind, vehicle_id, *params)
+        self._inflight: Dict[Tuple[Any, ...], "asyncio.Task[Any]"] = {}
+        # Serializes refresh/control calls per vehicle; LRU-capped at _MAX_VEHICLE_LOCKS
+        self._vehicle_locks: "OrderedDict[str, asyncio.Lock]" = OrderedDict()
+        # Dedicated pool so slow vendor HTTPS calls cannot starve the default executor
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=config.api_thread_workers or 16,
+            thread_name_prefix="hyundai-api",
+        )
+        # Event loop the client runs on, captured in initialize()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _run_blocking(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a blocking vendor call on the client's dedicated thread pool.
 
-    async def _is_token_expired_error(self, error: Exception) -> bool:
+        Unlike asyncio.to_thread this neither copies the contextvars context
+        nor wraps the call in a partial; arguments must be positional.
+        """
+        loop = self._loop
+        if loop is None:
+            loop = self._loop = asyncio.get_running_loop()
+        # The client is bound to a single event loop for its whole lifetime
+        assert loop is asyncio.get_running_loop(), "HyundaiAPIClient used from a different event loop"
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    async def shutdown(self, timeout: float = 5.0) -> None:
+        """
+        Release the API thread pool.
+
+        Queued calls are cancelled; calls already running get up to timeout
+        seconds to finish so the vendor session is not torn down mid-request.
+        """
+        try:
+            await asyncio.wait_for(
+                asyncio.to_thread(self._executor.shutdown, True, cancel_futures=True),
+                timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Hyundai API calls still running after %ss, not waiting further", timeout)
+
+    def _is_token_expired_error(self, error: BaseException) -> bool:
         """Check if error indicates token expiration."""
+        if isinstance(error, AuthenticationError):
+            return True
         error_str = str(error).lower()
-        return any(keyword in error_str for keyword in [
-            "token is expired",
-            "key not authorized: token is expired",
-            "authentication failed",
-            "unauthorized"
-        ])
-
-    async def _refresh_token_safely(self) -> None:
-        """Safely refresh token with concurrency protection."""
+        return any(keyword in error_str for keyword in _TOKEN_EXPIRED_KEYWORDS)
+
+    def _token_recently_refreshed(self, failed_at: Optional[float] = None) -> bool:
+        """
+        Whether the token refresh a caller needs has already happened.
+
+        With failed_at (monotonic start time of the call that saw the
+        expired token), any refresh completed after that point covers the
+        caller. Otherwise fall back to the _token_refresh_interval window.
+        """
+        last = self._last_refresh_monotonic
+        if last is None:
+            return False
+        if failed_at is not None:
+            return last >= failed_at
+        return time.monotonic() - last < self._token_refresh_interval
+
+    async def _refresh_token_safely(self, failed_at: Optional[float] = None) -> None:
+        """
+        Safely refresh token with concurrency protection.
+
+        Single-flight: concurrent callers queue on the lock and all but the
+        first find the refresh already done once they acquire it.
+        """
+        # Fast path: skip the lock entirely when a refresh just happened
+        if self._token_recently_refreshed(failed_at):
+            return
+        
         async with self._token_refresh_lock:
-            # Double-check pattern to avoid redundant refreshes
-            if self._last_refresh_time and \
-               (datetime.utcnow() - self._last_refresh_time).seconds < 30:
+            # Re-check: another task may have refreshed while we waited
+            if self._token_recently_refreshed(failed_at):
                 return
             
             if not self.vehicle_manager:
                 raise HyundaiAPIError("VehicleManager not initialized")
             
             logger.info("Refreshing expired token")
-            await asyncio.to_thread(self.vehicle_manager.check_and_refresh_token)
-            self._last_refresh_time = datetime.utcnow()
+            await self._run_blocking(self.vehicle_manager.check_and_refresh_token)
+            self._last_refresh_monotonic = time.monotonic()
             logger.info("Token refresh completed successfully")
 
-    async def _execute_with_retry(self, operation: Callable, *args, **kwargs) -> Any:
-        """Execute operation with token refresh and retry logic."""
-        try:
-            return await operation(*args, **kwargs)
-        except Exception as e:
-            if await self._is_token_expired_error(e):
-                logger.warning(f"Token expired detected, attempting refresh: {e}")
-                await self._refresh_token_safely()
-                logger.info("Retrying operation after token refresh")
-                return await operation(*args, **kwargs)
-            else:
-                # Re-raise non-token errors
-                raise
+    def _lock_for(self, vehicle_id: str) -> asyncio.Lock:
+        """Return the lock serializing API calls for one vehicle."""
+        # Get-then-create: setdefault(vid, asyncio.Lock()) would build a Lock
+        # on every call, and a defaultdict could not keep the LRU bound
+        lock = self._vehicle_locks.get(vehicle_id)
+        if lock is None:
+            if len(self._vehicle_locks) >= _MAX_VEHICLE_LOCKS:
+                # Evict the least recently used lock unless it is still held
+                oldest_id, oldest = next(iter(self._vehicle_locks.items()))
+                if not oldest.locked():
+                    del self._vehicle_locks[oldest_id]
+            lock = self._vehicle_locks[vehicle_id] = asyncio.Lock()
+        else:
+            self._vehicle_locks.move_to_end(vehicle_id)
+        return lock
+
+    def _require_vehicle_manager(self) -> VehicleManager:
+        """Return the VehicleManager, raising if initialize() has not run."""
+        if not self.vehicle_manager:
+            raise HyundaiAPIError("VehicleManager not initialized")
+        return self.vehicle_manager
+
+    async def _execute_with_retry(
+        self,
+        op_name: str,
+        vehicle_id: str,
+        sync_fn: Callable[..., Any],
+        *args: Any,
+        error_cls: Type[HyundaiMQTTError] = HyundaiAPIError,
+    ) -> Any:
+        """
+        Run a blocking vendor call behind the circuit breaker.
+
+        A token-expired error refreshes the token and retries, up to
+        _MAX_TOKEN_RETRIES times with jittered exponential backoff after the
+        first retry; any other _API_ERRORS failure (or running out of retries)
+        is recorded on the breaker and re-raised as error_cls("<op_name> failed: ...").
+        """
+        if not self.circuit_breaker.can_execute():
+            raise HyundaiAPIError("Circuit breaker is open")
+
+        for attempt in range(_MAX_TOKEN_RETRIES + 1):
+            started = time.monotonic()
+            try:
+                result = await self._run_blocking(sync_fn, *args)
+            except _API_ERRORS as e:
+                if attempt < _MAX_TOKEN_RETRIES and self._is_token_expired_error(e):
+                    logger.warning("Token expired detected, attempting refresh: %s", e)
+                    # Skipped if another task refreshed after this call started
+                    await self._refresh_token_safely(started)
+                    if attempt:
+                        # A refreshed token was rejected again; give the backend room
+                        await asyncio.sleep(
+                            min(_TOKEN_RETRY_MAX_DELAY, 2 ** attempt) + random.random()
+                        )
+                    logger.info("Retrying operation after token refresh (retry %d)", attempt + 1)
+                    continue
+                self.circuit_breaker.record_failure()
+                logger.error("%s failed for vehicle %s: %s", op_name, vehicle_id, e)
+                raise error_cls(f"{op_name} failed: {e}")
+            self.circuit_breaker.record_success()
+            return result
 
     async def initialize(self) -> None:
         """
         Authenticate and discover vehicles.
         Called once on startup.
         """
+        self._loop = asyncio.get_running_loop()
         try:
             logger.info(
                 "Initializing Hyundai API client",
                 extra={
-                    "region": self.config.region.name,
-                    "brand": self.config.brand.name,
+                    "region": REGION_NAMES[self.config.region],
+                    "brand": BRAND_NAMES[self.config.brand],
                 },
             )
 
@@ -157,127 +390,164 @@ class HyundaiAPIClient:
 
             # Authenticate using thread pool to avoid blocking event loop
             logger.debug("Authenticating with Hyundai API")
-            await asyncio.to_thread(self.vehicle_manager.check_and_refresh_token)
+            await self._run_blocking(self.vehicle_manager.check_and_refresh_token)
 
             # Discover vehicles using thread pool to avoid blocking event loop
             logger.debug("Discovering vehicles")
-            await asyncio.to_thread(self.vehicle_manager.update_all_vehicles_with_cached_state)
+            await self._run_blocking(self.vehicle_manager.update_all_vehicles_with_cached_state)
 
-            vehicle_count = len(self.vehicle_manager.vehicles)
-            logger.info(f"Hyundai API client initialized with {vehicle_count} vehicles")
+            self._vehicle_ids_cache = self._resolve_vehicle_ids()
+            
+            vehicle_count = len(self._vehicle_ids_cache)
+            logger.info("Hyundai API client initialized with %s vehicles", vehicle_count)
 
         except Exception as e:
-            logger.error(f"Failed to initialize Hyundai API client: {e}")
+            logger.error("Failed to initialize Hyundai API client: %s", e)
             raise HyundaiAPIError(f"Initialization failed: {e}")
 
-    async def refresh_cached(self, vehicle_id: str) -> VehicleData:
+    def _stale_or_raise(self, vehicle_id: str, error: Exception) -> VehicleData:
         """
-        Fast cached update using update_vehicle_with_cached_state().
-        Returns local cached data without API call.
+        Return the last-known-good data for vehicle_id marked as stale, or
+        re-raise error when stale fallback is disabled or nothing is known.
         """
-        if not self.circuit_breaker.can_execute():
-            raise HyundaiAPIError("Circuit breaker is open")
+        last_good = self._last_good.get(vehicle_id)
+        if not self.config.allow_stale or last_good is None:
+            raise error
+        logger.warning("Refresh failed for vehicle %s, serving stale data: %s", vehicle_id, error)
+        return replace(last_good, status=replace(last_good.status, data_source="stale"))
 
-        try:
-            logger.info(f"Performing cached refresh for vehicle {vehicle_id}")
+    def _invalidate_cached(self, vehicle_id: str) -> None:
+        """Drop the memoized refresh_cached result after remote state changed."""
+        self._cached_data.pop(vehicle_id, None)
 
-            if not self.vehicle_manager:
-                raise HyundaiAPIError("VehicleManager not initialized")
+    async def _coalesced(
+        self,
+        key: Tuple[Any, ...],
+        factory: Callable[[], Awaitable[_T]],
+    ) -> _T:
+        """
+        Run factory() once per key; concurrent callers with the same key
+        await the in-flight result instead of issuing a duplicate API call.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.debug("Joining in-flight %s call for vehicle %s", key[0], key[1])
 
-            # Wrap synchronous call in thread pool to avoid blocking event loop
-            logger.debug(f"Updating vehicle {vehicle_id} with cached state")
-            await asyncio.to_thread(self.vehicle_manager.update_vehicle_with_cached_state, vehicle_id)
-            vehicle = self.vehicle_manager.get_vehicle(vehicle_id)
+        # Shield so a cancelled waiter does not cancel the call for the others
+        return await asyncio.shield(task)
 
+    async def refresh_cached(self, vehicle_id: str) -> VehicleData:
+        """
+        Fast cached update using update_vehicle_with_cached_state().
+        Returns local cached data without API call.
+        """
+        hit = self._cached_data.get(vehicle_id)
+        if hit is not None and time.monotonic() - hit[0] < _CACHED_REFRESH_TTL:
+            return hit[1]
+        try:
+            return await self._coalesced(
+                ("cached", vehicle_id), lambda: self._refresh_cached(vehicle_id)
+            )
+        except (RefreshError, HyundaiAPIError) as e:
+            return self._stale_or_raise(vehicle_id, e)
+
+    async def _refresh_cached(self, vehicle_id: str) -> VehicleData:
+        """Body of refresh_cached(); callers go through the in-flight registry."""
+        logger.info("Performing cached refresh for vehicle %s", vehicle_id)
+        manager = self._require_vehicle_manager()
+
+        async with self._lock_for(vehicle_id):
+            # Check before the vendor call, which would fail with a bare KeyError;
+            # the manager updates this Vehicle instance in place
+            vehicle = manager.vehicles.get(vehicle_id)
             if not vehicle:
                 raise RefreshError(f"Vehicle {vehicle_id} not found")
 
-            self.circuit_breaker.record_success()
-            return map_vehicle_data(vehicle, "cached", "cached")
+            await self._execute_with_retry(
+                "Cached refresh", vehicle_id,
+                manager.update_vehicle_with_cached_state, vehicle_id,
+                error_cls=RefreshError,
+            )
 
-        except Exception as e:
-            if await self._is_token_expired_error(e):
-                logger.warning(f"Token expired detected, attempting refresh: {e}")
-                await self._refresh_token_safely()
-                logger.info("Retrying operation after token refresh")
-                return await self.refresh_cached(vehicle_id)
-            else:
-                self.circuit_breaker.record_failure()
-                logger.error(f"Cached refresh failed for vehicle {vehicle_id}: {e}")
-                raise RefreshError(f"Cached refresh failed: {e}")
+            data = map_vehicle_data(vehicle, "cached", "cached")
+            self._cached_data[vehicle_id] = (time.monotonic(), data)
+            self._last_good[vehicle_id] = data
+            return data
 
     async def refresh_force(self, vehicle_id: str) -> VehicleData:
         """
         Force refresh from vehicle using force_refresh_vehicle_state().
         Makes real API call to vehicle for fresh data.
         """
-        if not self.circuit_breaker.can_execute():
-            raise HyundaiAPIError("Circuit breaker is open")
-
-        try:
-            logger.info(f"Performing force refresh for vehicle {vehicle_id}")
-
-            if not self.vehicle_manager:
-                raise HyundaiAPIError("VehicleManager not initialized")
-
-            # Wrap synchronous call in thread pool to avoid blocking event loop
-            logger.debug(f"Forcing refresh of vehicle {vehicle_id}")
-            await asyncio.to_thread(self.vehicle_manager.force_refresh_vehicle_state, vehicle_id)
-            vehicle = self.vehicle_manager.get_vehicle(vehicle_id)
-
+        return await self._coalesced(
+            ("force", vehicle_id), lambda: self._refresh_force(vehicle_id)
+        )
+
+    async def _refresh_force(self, vehicle_id: str) -> VehicleData:
+        """Body of refresh_force(); callers go through the in-flight registry."""
+        logger.info("Performing force refresh for vehicle %s", vehicle_id)
+        manager = self._require_vehicle_manager()
+
+        async with self._lock_for(vehicle_id):
+            # Check before the vendor call, which would fail with a bare KeyError;
+            # the manager updates this Vehicle instance in place
+            vehicle = manager.vehicles.get(vehicle_id)
             if not vehicle:
                 raise RefreshError(f"Vehicle {vehicle_id} not found")
 
-            self.circuit_breaker.record_success()
-            return map_vehicle_data(vehicle, "fresh", "force")
+            await self._execute_with_retry(
+                "Force refresh", vehicle_id,
+                manager.force_refresh_vehicle_state, vehicle_id,
+                error_cls=RefreshError,
+            )
 
-        except Exception as e:
-            if await self._is_token_expired_error(e):
-                logger.warning(f"Token expired detected, attempting refresh: {e}")
-                await self._refresh_token_safely()
-                logger.info("Retrying operation after token refresh")
-                return await self.refresh_force(vehicle_id)
-            else:
-                self.circuit_breaker.record_failure()
-                logger.error(f"Force refresh failed for vehicle {vehicle_id}: {e}")
-                raise RefreshError(f"Force refresh failed: {e}")
+            self._invalidate_cached(vehicle_id)
+            data = self._last_good[vehicle_id] = map_vehicle_data(vehicle, "fresh", "force")
+            return data
 
     async def refresh_smart(self, vehicle_id: str, max_age_seconds: int) -> VehicleData:
         """
         Smart refresh using check_and_force_update_vehicle(seconds).
         Only refreshes if data is older than max_age_seconds.
         """
-        if not self.circuit_breaker.can_execute():
-            raise HyundaiAPIError("Circuit breaker is open")
-
         try:
-            logger.info(
-                f"Performing smart refresh for vehicle {vehicle_id}",
-                extra={"max_age_seconds": max_age_seconds},
+            return await self._coalesced(
+                ("smart", vehicle_id, max_age_seconds), lambda: self._refresh_smart(vehicle_id, max_age_seconds)
             )
-
-            if not self.vehicle_manager:
-                raise HyundaiAPIError("VehicleManager not initialized")
-
-            # Get vehicle and check timestamp before refresh
-            vehicle = self.vehicle_manager.get_vehicle(vehicle_id)
+        except (RefreshError, HyundaiAPIError) as e:
+            return self._stale_or_raise(vehicle_id, e)
+
+    async def _refresh_smart(self, vehicle_id: str, max_age_seconds: int) -> VehicleData:
+        """Body of refresh_smart(); callers go through the in-flight registry."""
+        logger.info(
+            "Performing smart refresh for vehicle %s",
+            vehicle_id,
+            extra={"max_age_seconds": max_age_seconds},
+        )
+        manager = self._require_vehicle_manager()
+
+        async with self._lock_for(vehicle_id):
+            # Get vehicle and check timestamp before refresh. VehicleManager
+            # keeps vehicles in a dict keyed by id; get_vehicle() would raise
+            # KeyError for unknown ids instead of reaching the not-found check
+            vehicle = manager.vehicles.get(vehicle_id)
             if not vehicle:
                 raise RefreshError(f"Vehicle {vehicle_id} not found")
 
             timestamp_before = getattr(vehicle, "last_updated_at", None)
 
-            # Perform smart refresh using thread pool to avoid blocking event loop
-            logger.debug(f"Checking and forcing update for vehicle {vehicle_id}")
-            await asyncio.to_thread(
-                self.vehicle_manager.check_and_force_update_vehicle,
-                max_age_seconds, vehicle_id
+            await self._execute_with_retry(
+                "Smart refresh", vehicle_id,
+                manager.check_and_force_update_vehicle, max_age_seconds, vehicle_id,
+                error_cls=RefreshError,
             )
 
-            # Get vehicle again to check if data was actually refreshed
-            vehicle = self.vehicle_manager.get_vehicle(vehicle_id)
-            if not vehicle:
-                raise RefreshError(f"Vehicle {vehicle_id} not found")
-
+            # VehicleManager updates the same Vehicle instance in place, so the
+            # reference fetched above already holds the refreshed data.
             # Determine if data is fresh or cached based on timestamp change
             timestamp_after = getattr(vehicle, "last_updated_at", None)
 
@@ -288,49 +558,55 @@ class HyundaiAPIClient:
                 and timestamp_after > timestamp_before
             ):
                 data_source = "fresh"
-                logger.info(
-                    f"Smart refresh fetched fresh data for vehicle {vehicle_id}"
-                )
+                logger.info("Smart refresh fetched fresh data for vehicle %s", vehicle_id)
             else:
                 data_source = "cached"
-                logger.info(f"Smart refresh used cached data for vehicle {vehicle_id}")
+                logger.info("Smart refresh used cached data for vehicle %s", vehicle_id)
 
-            self.circuit_breaker.record_success()
-            return map_vehicle_data(vehicle, data_source, "smart")
-
-        except Exception as e:
-            if await self._is_token_expired_error(e):
-                logger.warning(f"Token expired detected, attempting refresh: {e}")
-                await self._refresh_token_safely()
-                logger.info("Retrying operation after token refresh")
-                return await self.refresh_smart(vehicle_id, max_age_seconds)
-            else:
-                self.circuit_breaker.record_failure()
-                logger.error(f"Smart refresh failed for vehicle {vehicle_id}: {e}")
-                raise RefreshError(f"Smart refresh failed: {e}")
+            self._invalidate_cached(vehicle_id)
+            data = self._last_good[vehicle_id] = map_vehicle_data(vehicle, data_source, "smart")
+            return data
 
     def get_vehicle_ids(self) -> List[str]:
-        """Return list of available vehicle IDs."""
+        """Return list of available vehicle IDs (discovered at initialize)."""
+        return self._vehicle_ids_cache or []
+
+    def _resolve_vehicle_ids(self) -> List[str]:
+        """Extract vehicle IDs from the VehicleManager's discovered vehicles."""
         if not self.vehicle_manager:
             return []
 
-        # Check if vehicles are strings (vehicle IDs) or objects
-        vehicle_ids = []
-        for vehicle in self.vehicle_manager.vehicles:
-            if isinstance(vehicle, str):
-                vehicle_ids.append(vehicle)
-            elif hasattr(vehicle, 'id'):
-                vehicle_ids.append(vehicle.id)
-            elif hasattr(vehicle, 'vin'):
-                vehicle_ids.append(vehicle.vin)
-            else:
-                # Fallback: use string representation
-                vehicle_ids.append(str(vehicle))
-        
-        return vehicle_ids
+        vehicles = self.vehicle_manager.vehicles
+        # The container is homogeneous: pick the ID accessor once from the
+        # first entry (strings are IDs already; VehicleManager keys its dict by ID)
+        first = next(iter(vehicles), None)
+        if first is None or isinstance(first, str):
+            return list(vehicles)
+        if hasattr(first, "id"):
+            get_id: Callable[[Any], str] = attrgetter("id")
+        elif hasattr(first, "vin"):
+            get_id = attrgetter("vin")
+        else:
+            # Fallback: use string representation
+            get_id = str
+        return [get_id(vehicle) for vehicle in vehicles]
 
     # ===== Control Command Methods =====
 
+    @staticmethod
+    def _build_options(
+        options_cls: Callable[..., Any],
+        fields: Tuple[str, ...],
+        options: Dict[str, Any],
+    ) -> Any:
+        """
+        Convert an options dict to a fresh vendor request-options object.
+
+        Built per command: the vendor fills unset fields in place, so
+        instances must never be shared between calls.
+        """
+        return options_cls(**{name: options.get(name) for name in fields})
+
     async def lock_vehicle(self, vehicle_id: str) -> str:
         """
         Lock vehicle doors.
@@ -341,35 +617,17 @@ class HyundaiAPIClient:
         Raises:
             HyundaiAPIError: If circuit breaker is open or execution fails
         """
-        if not self.circuit_breaker.can_execute():
-            raise HyundaiAPIError("Circuit breaker is open")
-        
-        try:
-            logger.info(f"Executing lock command for vehicle {vehicle_id}")
-            
-            if not self.vehicle_manager:
-                raise HyundaiAPIError("VehicleManager not initialized")
-            
-            # Execute via thread pool - DO NOT assume success
-            action_id = await asyncio.to_thread(
-                self.vehicle_manager.lock,
-                vehicle_id
+        logger.info("Executing lock command for vehicle %s", vehicle_id)
+        manager = self._require_vehicle_manager()
+
+        async with self._lock_for(vehicle_id):
+            # DO NOT assume success - the returned action_id must be tracked
+            action_id = await self._execute_with_retry(
+                "Lock command", vehicle_id, manager.lock, vehicle_id
             )
-            
-            self.circuit_breaker.record_success()
-            logger.info(f"Lock command initiated with action_id: {action_id}")
+            self._invalidate_cached(vehicle_id)
+            logger.info("Lock command initiated with action_id: %s", action_id)
             return action_id
-            
-        except Exception as e:
-            if await self._is_token_expired_error(e):
-                logger.warning(f"Token expired detected, attempting refresh: {e}")
-                await self._refresh_token_safely()
-                logger.info("Retrying operation after token refresh")
-                return await self.lock_vehicle(vehicle_id)
-            else:
-                self.circuit_breaker.record_failure()
-                logger.error(f"Lock command failed for vehicle {vehicle_id}: {e}")
-                raise HyundaiAPIError(f"Lock command failed: {e}")
 
     async def unlock_vehicle(self, vehicle_id: str) -> str:
         """
@@ -381,35 +639,16 @@ class HyundaiAPIClient:
         Raises:
             HyundaiAPIError: If circuit breaker is open or execution fails
         """
-        if not self.circuit_breaker.can_execute():
-            raise HyundaiAPIError("Circuit breaker is open")
-        
-        try:
-            logger.info(f"Executing unlock command for vehicle {vehicle_id}")
-            
-            if not self.vehicle_manager:
-                raise HyundaiAPIError("VehicleManager not initialized")
-            
-            # Execute via thread pool - DO NOT assume success
-            action_id = await asyncio.to_thread(
-                self.vehicle_manager.unlock,
-                vehicle_id
+        logger.info("Executing unlock command for vehicle %s", vehicle_id)
+        manager = self._require_vehicle_manager()
+
+        async with self._lock_for(vehicle_id):
+            action_id = await self._execute_with_retry(
+                "Unlock command", vehicle_id, manager.unlock, vehicle_id
             )
-            
-            self.circuit_breaker.record_success()
-            logger.info(f"Unlock command initiated with action_id: {action_id}")
+            self._invalidate_cached(vehicle_id)
+            logger.info("Unlock command initiated with action_id: %s", action_id)
             return action_id
-            
-        except Exception as e:
-            if await self._is_token_expired_error(e):
-                logger.warning(f"Token expired detected, attempting refresh: {e}")
-                await self._refresh_token_safely()
-                logger.info("Retrying operation after token refresh")
-                return await self.unlock_vehicle(vehicle_id)
-            else:
-                self.circuit_breaker.record_failure()
-                logger.error(f"Unlock command failed for vehicle {vehicle_id}: {e}")
-                raise HyundaiAPIError(f"Unlock command failed: {e}")
 
     async def start_climate(self, vehicle_id: str, options: Any) -> str:
         """
@@ -425,49 +664,19 @@ class HyundaiAPIClient:
         Raises:
             HyundaiAPIError: If circuit breaker is open or execution fails
         """
-        if not self.circuit_breaker.can_execute():
-            raise HyundaiAPIError("Circuit breaker is open")
-        
-        try:
-            logger.info(f"Executing start climate command for vehicle {vehicle_id} with options: {options}")
-            
-            if not self.vehicle_manager:
-                raise HyundaiAPIError("VehicleManager not initialized")
-            
-            # Convert dictionary to ClimateRequestOptions object
-            climate_options = ClimateRequestOptions(
-                set_temp=options.get("set_temp"),
-                duration=options.get("duration"),
-                defrost=options.get("defrost"),
-                climate=options.get("climate"),
-                steering_wheel=options.get("steering_wheel"),
-                front_left_seat=options.get("front_left_seat"),
-                front_right_seat=options.get("front_right_seat"),
-                rear_left_seat=options.get("rear_left_seat"),
-                rear_right_seat=options.get("rear_right_seat")
-            )
-            
-            # Execute via thread pool - DO NOT assume success
-            action_id = await asyncio.to_thread(
-                self.vehicle_manager.start_climate,
-                vehicle_id,
-                climate_options
+        logger.info("Executing start climate command for vehicle %s with options: %s", vehicle_id, options)
+        manager = self._require_vehicle_manager()
+
+        async with self._lock_for(vehicle_id):
+            climate_options = self._build_options(ClimateRequestOptions, _CLIMATE_OPTION_FIELDS, options)
+
+            action_id = await self._execute_with_retry(
+                "Start climate command", vehicle_id,
+                manager.start_climate, vehicle_id, climate_options,
             )
-            
-            self.circuit_breaker.record_success()
-            logger.info(f"Start climate command initiated with action_id: {action_id}")
+            self._invalidate_cached(vehicle_id)
+            logger.info("Start climate command initiated with action_id: %s", action_id)
             return action_id
-            
-        except Exception as e:
-            if await self._is_token_expired_error(e):
-                logger.warning(f"Token expired detected, attempting refresh: {e}")
-                await self._refresh_token_safely()
-                logger.info("Retrying operation after token refresh")
-                return await self.start_climate(vehicle_id, options)
-            else:
-                self.circuit_breaker.record_failure()
-                logger.error(f"Start climate command failed for vehicle {vehicle_id}: {e}")
-                raise HyundaiAPIError(f"Start climate command failed: {e}")
 
     async def stop_climate(self, vehicle_id: str) -> str:
         """
@@ -479,43 +688,24 @@ class HyundaiAPIClient:
         Raises:
             HyundaiAPIError: If circuit breaker is open or execution fails
         """
-        if not self.circuit_breaker.can_execute():
-            raise HyundaiAPIError("Circuit breaker is open")
-        
-        try:
-            logger.info(f"Executing stop climate command for vehicle {vehicle_id}")
-            
-            if not self.vehicle_manager:
-                raise HyundaiAPIError("VehicleManager not initialized")
-            
+        logger.info("Executing stop climate command for vehicle %s", vehicle_id)
+        manager = self._require_vehicle_manager()
+
+        async with self._lock_for(vehicle_id):
             # Check if climate is currently on before stopping
-            vehicle = self.vehicle_manager.get_vehicle(vehicle_id)
+            vehicle = manager.vehicles.get(vehicle_id)
             if vehicle:
                 climate_is_on = getattr(vehicle, 'air_ctrl_is_on', None)
-                logger.info(f"Vehicle climate status before command: air_ctrl_is_on={climate_is_on}")
-            
-            # Execute via thread pool - DO NOT assume success
-            action_id = await asyncio.to_thread(
-                self.vehicle_manager.stop_climate,
-                vehicle_id
+                logger.info("Vehicle climate status before command: air_ctrl_is_on=%s", climate_is_on)
+
+            action_id = await self._execute_with_retry(
+                "Stop climate command", vehicle_id, manager.stop_climate, vehicle_id
             )
-            
-            logger.info(f"stop_climate returned action_id: {action_id} (type: {type(action_id)})")
-            
-            self.circuit_breaker.record_success()
-            logger.info(f"Stop climate command initiated with action_id: {action_id}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("stop_climate returned action_id: %s (type: %s)", action_id, type(action_id))
+            self._invalidate_cached(vehicle_id)
+            logger.info("Stop climate command initiated with action_id: %s", action_id)
             return action_id
-            
-        except Exception as e:
-            if await self._is_token_expired_error(e):
-                logger.warning(f"Token expired detected, attempting refresh: {e}")
-                await self._refresh_token_safely()
-                logger.info("Retrying operation after token refresh")
-                return await self.stop_climate(vehicle_id)
-            else:
-                self.circuit_breaker.record_failure()
-                logger.error(f"Stop climate command failed for vehicle {vehicle_id}: {e}")
-                raise HyundaiAPIError(f"Stop climate command failed: {e}")
 
     async def set_windows_state(self, vehicle_id: str, options: Any) -> str:
         """
@@ -531,44 +721,19 @@ class HyundaiAPIClient:
         Raises:
             HyundaiAPIError: If circuit breaker is open or execution fails
         """
-        if not self.circuit_breaker.can_execute():
-            raise HyundaiAPIError("Circuit breaker is open")
-        
-        try:
-            logger.info(f"Executing set windows command for vehicle {vehicle_id} with options: {options}")
-            
-            if not self.vehicle_manager:
-                raise HyundaiAPIError("VehicleManager not initialized")
-            
-            # Convert dictionary to WindowRequestOptions object
-            window_options = WindowRequestOptions(
-                front_left=options.get("front_left"),
-                front_right=options.get("front_right"),
-                back_left=options.get("back_left"),
-                back_right=options.get("back_right")
-            )
-            
-            # Execute via thread pool - DO NOT assume success
-            action_id = await asyncio.to_thread(
-                self.vehicle_manager.set_windows_state,
-                vehicle_id,
-                window_options
+        logger.info("Executing set windows command for vehicle %s with options: %s", vehicle_id, options)
+        manager = self._require_vehicle_manager()
+
+        async with self._lock_for(vehicle_id):
+            window_options = self._build_options(WindowRequestOptions, _WINDOW_OPTION_FIELDS, options)
+
+            action_id = await self._execute_with_retry(
+                "Set windows command", vehicle_id,
+                manager.set_windows_state, vehicle_id, window_options,
             )
-            
-            self.circuit_breaker.record_success()
-            logger.info(f"Set windows command initiated with action_id: {action_id}")
+            self._invalidate_cached(vehicle_id)
+            logger.info("Set windows command initiated with action_id: %s", action_id)
             return action_id
-            
-        except Exception as e:
-            if await self._is_token_expired_error(e):
-                logger.warning(f"Token expired detected, attempting refresh: {e}")
-                await self._refresh_token_safely()
-                logger.info("Retrying operation after token refresh")
-                return await self.set_windows_state(vehicle_id, options)
-            else:
-                self.circuit_breaker.record_failure()
-                logger.error(f"Set windows command failed for vehicle {vehicle_id}: {e}")
-                raise HyundaiAPIError(f"Set windows command failed: {e}")
 
     async def open_charge_port(self, vehicle_id: str) -> str:
         """
@@ -580,35 +745,16 @@ class HyundaiAPIClient:
         Raises:
             HyundaiAPIError: If circuit breaker is open or execution fails
         """
-        if not self.circuit_breaker.can_execute():
-            raise HyundaiAPIError("Circuit breaker is open")
-        
-        try:
-            logger.info(f"Executing open charge port command for vehicle {vehicle_id}")
-            
-            if not self.vehicle_manager:
-                raise HyundaiAPIError("VehicleManager not initialized")
-            
-            # Execute via thread pool - DO NOT assume success
-            action_id = await asyncio.to_thread(
-                self.vehicle_manager.open_charge_port,
-                vehicle_id
+        logger.info("Executing open charge port command for vehicle %s", vehicle_id)
+        manager = self._require_vehicle_manager()
+
+        async with self._lock_for(vehicle_id):
+            action_id = await self._execute_with_retry(
+                "Open charge port command", vehicle_id, manager.open_charge_port, vehicle_id
             )
-            
-            self.circuit_breaker.record_success()
-            logger.info(f"Open charge port command initiated with action_id: {action_id}")
+            self._invalidate_cached(vehicle_id)
+            logger.info("Open charge port command initiated with action_id: %s", action_id)
             return action_id
-            
-        except Exception as e:
-            if await self._is_token_expired_error(e):
-                logger.warning(f"Token expired detected, attempting refresh: {e}")
-                await self._refresh_token_safely()
-                logger.info("Retrying operation after token refresh")
-                return await self.open_charge_port(vehicle_id)
-            else:
-                self.circuit_breaker.record_failure()
-                logger.error(f"Open charge port command failed for vehicle {vehicle_id}: {e}")
-                raise HyundaiAPIError(f"Open charge port command failed: {e}")
 
     async def close_charge_port(self, vehicle_id: str) -> str:
         """
@@ -620,35 +766,16 @@ class HyundaiAPIClient:
         Raises:
             HyundaiAPIError: If circuit breaker is open or execution fails
         """
-        if not self.circuit_breaker.can_execute():
-            raise HyundaiAPIError("Circuit breaker is open")
-        
-        try:
-            logger.info(f"Executing close charge port command for vehicle {vehicle_id}")
-            
-            if not self.vehicle_manager:
-                raise HyundaiAPIError("VehicleManager not initialized")
-            
-            # Execute via thread pool - DO NOT assume success
-            action_id = await asyncio.to_thread(
-                self.vehicle_manager.close_charge_port,
-                vehicle_id
+        logger.info("Executing close charge port command for vehicle %s", vehicle_id)
+        manager = self._require_vehicle_manager()
+
+        async with self._lock_for(vehicle_id):
+            action_id = await self._execute_with_retry(
+                "Close charge port command", vehicle_id, manager.close_charge_port, vehicle_id
             )
-            
-            self.circuit_breaker.record_success()
-            logger.info(f"Close charge port command initiated with action_id: {action_id}")
+            self._invalidate_cached(vehicle_id)
+            logger.info("Close charge port command initiated with action_id: %s", action_id)
             return action_id
-            
-        except Exception as e:
-            if await self._is_token_expired_error(e):
-                logger.warning(f"Token expired detected, attempting refresh: {e}")
-                await self._refresh_token_safely()
-                logger.info("Retrying operation after token refresh")
-                return await self.close_charge_port(vehicle_id)
-            else:
-                self.circuit_breaker.record_failure()
-                logger.error(f"Close charge port command failed for vehicle {vehicle_id}: {e}")
-                raise HyundaiAPIError(f"Close charge port command failed: {e}")
 
     async def set_charging_current(self, vehicle_id: str, level: int) -> str:
         """
@@ -664,36 +791,17 @@ class HyundaiAPIClient:
         Raises:
             HyundaiAPIError: If circuit breaker is open or execution fails
         """
-        if not self.circuit_breaker.can_execute():
-            raise HyundaiAPIError("Circuit breaker is open")
-        
-        try:
-            logger.info(f"Executing set charging current command for vehicle {vehicle_id} with level: {level}")
-            
-            if not self.vehicle_manager:
-                raise HyundaiAPIError("VehicleManager not initialized")
-            
-            # Execute via thread pool - DO NOT assume success
-            action_id = await asyncio.to_thread(
-                self.vehicle_manager.set_charging_current,
-                vehicle_id,
-                level
+        logger.info("Executing set charging current command for vehicle %s with level: %s", vehicle_id, level)
+        manager = self._require_vehicle_manager()
+
+        async with self._lock_for(vehicle_id):
+            action_id = await self._execute_with_retry(
+                "Set charging current command", vehicle_id,
+                manager.set_charging_current, vehicle_id, level,
             )
-            
-            self.circuit_breaker.record_success()
-            logger.info(f"Set charging current command initiated with action_id: {action_id}")
+            self._invalidate_cached(vehicle_id)
+            logger.info("Set charging current command initiated with action_id: %s", action_id)
             return action_id
-            
-        except Exception as e:
-            if await self._is_token_expired_error(e):
-                logger.warning(f"Token expired detected, attempting refresh: {e}")
-                await self._refresh_token_safely()
-                logger.info("Retrying operation after token refresh")
-                return await self.set_charging_current(vehicle_id, level)
-            else:
-                self.circuit_breaker.record_failure()
-                logger.error(f"Set charging current command failed for vehicle {vehicle_id}: {e}")
-                raise HyundaiAPIError(f"Set charging current command failed: {e}")
 
     async def check_action_status(
         self,
@@ -715,50 +823,55 @@ class HyundaiAPIClient:
             Final status: "SUCCESS", "FAILED", "TIMEOUT", or "UNKNOWN"
         
         Implementation:
-            - Polls every 5 seconds if synchronous=True
+            - If synchronous=True, polls after 1, 2, 3 and then every 5 seconds
+              until a non-PENDING status or timeout_seconds elapses ("TIMEOUT")
             - Returns immediately with current status if synchronous=False
             - Uses EU-specific timeout configurations per command type
         """
-        if not self.circuit_breaker.can_execute():
-            raise HyundaiAPIError("Circuit breaker is open")
-        
-        try:
-            if not self.vehicle_manager:
-                raise HyundaiAPIError("VehicleManager not initialized")
-            
-            if synchronous:
-                # Use API's built-in synchronous polling
-                status_response = await asyncio.to_thread(
-                    self.vehicle_manager.check_action_status,
-                    vehicle_id,
-                    action_id,
-                    synchronous=True,  # Let API handle polling internally
-                    timeout=timeout_seconds
-                )
-                
-                # Parse final status from response
-                status = self._parse_action_status(status_response)
-                logger.info(f"Action {action_id} reached terminal state: {status}")
+        return await self._coalesced(
+            ("status", vehicle_id, action_id, synchronous),
+            lambda: self._check_action_status(vehicle_id, action_id, synchronous, timeout_seconds),
+        )
+
+    async def _check_action_status(
+        self,
+        vehicle_id: str,
+        action_id: str,
+        synchronous: bool,
+        timeout_seconds: int,
+    ) -> str:
+        """Body of check_action_status(); callers go through the in-flight registry."""
+        manager = self._require_vehicle_manager()
+
+        if not synchronous:
+            # Single status check
+            status_response = await self._execute_with_retry(
+                "Action status check", vehicle_id,
+                manager.check_action_status, vehicle_id, action_id,
+            )
+            return self._parse_action_status(status_response)
+
+        # Poll with our own backoff instead of the vendor's fixed 5s sleep, which
+        # would also hold an executor thread for the whole wait
+        deadline = time.monotonic() + timeout_seconds
+        for delay in chain(_STATUS_POLL_DELAYS, repeat(_STATUS_POLL_DELAYS[-1])):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(delay, remaining))
+
+            status_response = await self._execute_with_retry(
+                "Action status check", vehicle_id,
+                manager.check_action_status, vehicle_id, action_id,
+            )
+            status = self._parse_action_status(status_response)
+            if status != "PENDING":
+                # Any other state is final
+                logger.info("Action %s reached terminal state: %s", action_id, status)
                 return status
-            else:
-                # Single status check
-                status_response = await asyncio.to_thread(
-                    self.vehicle_manager.check_action_status,
-                    vehicle_id,
-                    action_id
-                )
-                return self._parse_action_status(status_response)
-                
-        except Exception as e:
-            if await self._is_token_expired_error(e):
-                logger.warning(f"Token expired detected, attempting refresh: {e}")
-                await self._refresh_token_safely()
-                logger.info("Retrying operation after token refresh")
-                return await self.check_action_status(vehicle_id, action_id, synchronous, timeout_seconds)
-            else:
-                self.circuit_breaker.record_failure()
-                logger.error(f"Action status check failed: {e}")
-                raise HyundaiAPIError(f"Action status check failed: {e}")
+
+        logger.info("Action %s still pending after %ss, reporting TIMEOUT", action_id, timeout_seconds)
+        return "TIMEOUT"
 
     def _parse_action_status(self, status_response: Any) -> str:
         """
@@ -772,40 +885,21 @@ class HyundaiAPIClient:
             Status string: "SUCCESS", "FAILED", "PENDING", "TIMEOUT", or "UNKNOWN"
         """
         # Handle ORDER_STATUS enum objects (from hyundai_kia_connect_api.ApiImpl)
-        # VehicleManager.check_action_status() returns ORDER_STATUS enum members
-        if hasattr(status_response, 'name'):
-            # It's an enum - use the name directly
+        # VehicleManager.check_action_status() returns ORDER_STATUS enum members,
+        # so try the attribute first and only type-check the rare fallbacks
+        try:
             return status_response.name
-        
+        except AttributeError:
+            pass
+
         # Handle string responses
-        elif isinstance(status_response, str):
-            status_upper = status_response.upper()
-            if "SUCCESS" in status_upper or "COMPLETE" in status_upper:
-                return "SUCCESS"
-            elif "FAIL" in status_upper or "ERROR" in status_upper:
-                return "FAILED"
-            elif "PENDING" in status_upper or "PROCESSING" in status_upper:
-                return "PENDING"
-            elif "TIMEOUT" in status_upper:
-                return "TIMEOUT"
-            else:
-                return "UNKNOWN"
-        
+        if isinstance(status_response, str):
+            return _classify_status_string(status_response)
+
         # Handle dictionary responses
-        elif isinstance(status_response, dict):
-            # Try to extract status from dict
-            status = status_response.get("status", "").upper()
-            if "SUCCESS" in status or "COMPLETE" in status:
-                return "SUCCESS"
-            elif "FAIL" in status or "ERROR" in status:
-                return "FAILED"
-            elif "PENDING" in status or "PROCESSING" in status:
-                return "PENDING"
-            elif "TIMEOUT" in status:
-                return "TIMEOUT"
-            else:
-                return "UNKNOWN"
-        else:
-            # Unknown response format
-            logger.warning(f"Unknown action status response format: {type(status_response)}")
-            return "UNKNOWN"
+        if isinstance(status_response, dict):
+            return _classify_status_string(str(status_response.get("status", "")))
+
+        # Unknown response format
+        logger.warning("Unknown action status response format: %s", type(status_response))
+        return "UNKNOWN"
@@ -1,8 +1,22 @@
 """Data mapping from Hyundai API objects to structured models."""
 
-from dataclasses import asdict, dataclass, field
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Tuple, Union
+
+
+def _utcnow() -> datetime:
+    """Current UTC time as a naive datetime (the codebase-wide convention)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@lru_cache(maxsize=16)
+def _iso_utc(ts: datetime) -> str:
+    """Format a UTC datetime as ISO 8601 with a Z suffix; repeat stamps hit the cache."""
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(timezone.utc).replace(tzinfo=None)
+    return ts.isoformat() + "Z"
 
 
 # Seat status mapping for climate control
@@ -26,20 +40,22 @@ WINDOW_STATE_MAP = {
 }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BatteryData:
     """Battery-related metrics from vehicle."""
     level: Optional[float] = None  # Battery percentage (0-100)
     charging_status: Optional[str] = None  # "charging", "not_charging", etc.
     plug_status: Optional[str] = None  # "connected", "disconnected"
     temperature: Optional[float] = None  # Battery temperature in Celsius
+    _FIELDS: ClassVar[Tuple[str, ...]] = ("level", "charging_status", "plug_status", "temperature")
+    _MQTT_TOPICS: ClassVar[Tuple[str, ...]] = tuple(f"battery/{name}" for name in _FIELDS)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary, excluding None values."""
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        return {k: v for k in self._FIELDS if (v := getattr(self, k)) is not None}
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EVData:
     """Electric vehicle-specific metrics."""
     range: Optional[float] = None  # Remaining range in km
@@ -47,13 +63,21 @@ class EVData:
     charge_time_target: Optional[int] = None  # Minutes to target charge
     charge_limit: Optional[int] = None  # Max charge limit (%)
     energy_consumption: Optional[float] = None  # kWh/100km or similar
+    _FIELDS: ClassVar[Tuple[str, ...]] = (
+        "range",
+        "charge_time_100",
+        "charge_time_target",
+        "charge_limit",
+        "energy_consumption",
+    )
+    _MQTT_TOPICS: ClassVar[Tuple[str, ...]] = tuple(f"ev/{name}" for name in _FIELDS)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary, excluding None values."""
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        return {k: v for k in self._FIELDS if (v := getattr(self, k)) is not None}
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StatusData:
     """Metadata about the data fetch."""
     last_updated: datetime  # When data was last updated
@@ -63,13 +87,13 @@ class StatusData:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary with ISO formatted timestamp."""
         return {
-            "last_updated": self.last_updated.isoformat() + "Z",
+            "last_updated": _iso_utc(self.last_updated),
             "data_source": self.data_source,
             "update_method": self.update_method
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DoorData:
     """Door lock and open status."""
     locked: Optional[bool] = None  # Overall lock status
@@ -83,13 +107,27 @@ class DoorData:
     front_right_locked: Optional[bool] = None
     back_left_locked: Optional[bool] = None
     back_right_locked: Optional[bool] = None
-    
+    _FIELDS: ClassVar[Tuple[str, ...]] = (
+        "locked",
+        "front_left_open",
+        "front_right_open",
+        "back_left_open",
+        "back_right_open",
+        "trunk_open",
+        "hood_open",
+        "front_left_locked",
+        "front_right_locked",
+        "back_left_locked",
+        "back_right_locked",
+    )
+    _MQTT_TOPICS: ClassVar[Tuple[str, ...]] = tuple(f"doors/{name}" for name in _FIELDS)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary, excluding None values."""
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        return {k: v for k in self._FIELDS if (v := getattr(self, k)) is not None}
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WindowData:
     """Window state (WINDOW_STATE: 0=CLOSED, 1=OPEN, 2=VENTILATION)."""
     front_left: Optional[int] = None
@@ -97,11 +135,19 @@ class WindowData:
     back_left: Optional[int] = None
     back_right: Optional[int] = None
     sunroof: Optional[int] = None
-    
+    _FIELDS: ClassVar[Tuple[str, ...]] = (
+        "front_left",
+        "front_right",
+        "back_left",
+        "back_right",
+        "sunroof",
+    )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary with human-readable values."""
         result = {}
-        for key, value in asdict(self).items():
+        for key in self._FIELDS:
+            value = getattr(self, key)
             if value is not None:
                 result[key] = {
                     "value": value,
@@ -110,7 +156,7 @@ class WindowData:
         return result
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ClimateData:
     """Climate control status."""
     is_on: Optional[bool] = None
@@ -125,11 +171,26 @@ class ClimateData:
     front_right_seat_status: Optional[int] = None
     rear_left_seat_status: Optional[int] = None
     rear_right_seat_status: Optional[int] = None
-    
+    _FIELDS: ClassVar[Tuple[str, ...]] = (
+        "is_on",
+        "set_temperature",
+        "current_temperature",
+        "defrost",
+        "heated_steering_wheel",
+        "heated_side_mirror",
+        "heated_rear_window",
+        "air_control",
+        "front_left_seat_status",
+        "front_right_seat_status",
+        "rear_left_seat_status",
+        "rear_right_seat_status",
+    )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary with seat status mappings."""
         result = {}
-        for key, value in asdict(self).items():
+        for key in self._FIELDS:
+            value = getattr(self, key)
             if value is None:
                 continue
             if "seat_status" in key:
@@ -142,7 +203,7 @@ class ClimateData:
         return result
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LocationData:
     """Vehicle location and geocoded information."""
     latitude: Optional[float] = None
@@ -153,16 +214,26 @@ class LocationData:
     address: Optional[str] = None  # Geocoded address
     place_name: Optional[str] = None  # Place name (if available)
     last_updated: Optional[datetime] = None
-    
+    _FIELDS: ClassVar[Tuple[str, ...]] = (
+        "latitude",
+        "longitude",
+        "speed",
+        "heading",
+        "altitude",
+        "address",
+        "place_name",
+        "last_updated",
+    )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary with ISO formatted timestamp."""
-        result = {k: v for k, v in asdict(self).items() if v is not None}
+        result = {k: v for k in self._FIELDS if (v := getattr(self, k)) is not None}
         if self.last_updated:
-            result["last_updated"] = self.last_updated.isoformat() + "Z"
+            result["last_updated"] = _iso_utc(self.last_updated)
         return result
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TireData:
     """Tire pressure warnings."""
     front_left_warning: Optional[bool] = None
@@ -170,36 +241,48 @@ class TireData:
     back_left_warning: Optional[bool] = None
     back_right_warning: Optional[bool] = None
     all_normal: Optional[bool] = None
-    
+    _FIELDS: ClassVar[Tuple[str, ...]] = (
+        "front_left_warning",
+        "front_right_warning",
+        "back_left_warning",
+        "back_right_warning",
+        "all_normal",
+    )
+    _MQTT_TOPICS: ClassVar[Tuple[str, ...]] = tuple(f"tires/{name}" for name in _FIELDS)
+
     def to_dict(self) -> Dict[str, Any]:
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        return {k: v for k in self._FIELDS if (v := getattr(self, k)) is not None}
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ServiceData:
     """Service interval information."""
     next_service_distance: Optional[float] = None
     next_service_unit: Optional[str] = None  # "km" or "mi"
     last_service_distance: Optional[float] = None
     last_service_unit: Optional[str] = None
-    
+    _FIELDS: ClassVar[Tuple[str, ...]] = ("next_service_distance", "next_service_unit", "last_service_distance", "last_service_unit")
+    _MQTT_TOPICS: ClassVar[Tuple[str, ...]] = tuple(f"service/{name}" for name in _FIELDS)
+
     def to_dict(self) -> Dict[str, Any]:
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        return {k: v for k in self._FIELDS if (v := getattr(self, k)) is not None}
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EngineData:
     """Engine status for ICE/PHEV/HEV vehicles."""
     is_running: Optional[bool] = None
     fuel_level: Optional[float] = None  # Percentage
     fuel_range: Optional[float] = None  # km or mi
     fuel_unit: Optional[str] = None
-    
+    _FIELDS: ClassVar[Tuple[str, ...]] = ("is_running", "fuel_level", "fuel_range", "fuel_unit")
+    _MQTT_TOPICS: ClassVar[Tuple[str, ...]] = tuple(f"engine/{name}" for name in _FIELDS)
+
     def to_dict(self) -> Dict[str, Any]:
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        return {k: v for k in self._FIELDS if (v := getattr(self, k)) is not None}
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VehicleData:
     """Complete vehicle data payload with all systems."""
     vehicle_id: str
@@ -219,81 +302,85 @@ class VehicleData:
     total_power_regenerated: Optional[float] = None  # Wh
     power_consumption_30d: Optional[float] = None  # Wh
 
-    def to_mqtt_messages(self) -> List[Tuple[str, Union[str, int, float, Dict]]]:
-        """Convert to list of (metric_name, data) tuples for MQTT publishing."""
-        messages: List[Tuple[str, Union[str, int, float, Dict]]] = []
-        
-        # Battery data
-        battery_dict = self.battery.to_dict()
-        for key, value in battery_dict.items():
-            messages.append((f"battery/{key}", value))
-        
-        # EV data
-        ev_dict = self.ev.to_dict()
-        for key, value in ev_dict.items():
-            messages.append((f"ev/{key}", value))
-        
-        # New system data
-        for key, value in self.doors.to_dict().items():
-            messages.append((f"doors/{key}", value))
-        
+    def iter_mqtt_messages(self) -> Iterator[Tuple[str, Union[str, int, float, Dict]]]:
+        """Yield (metric_name, data) tuples for MQTT publishing, skipping unset metrics."""
+        # Flat sections: read fields directly against precomputed topic names
+        for section in (self.battery, self.ev, self.doors):
+            for topic, key in zip(section._MQTT_TOPICS, section._FIELDS):
+                value = getattr(section, key)
+                if value is not None:
+                    yield (topic, value)
+
+        # Sections whose values are reshaped for publishing
         for key, value in self.windows.to_dict().items():
-            messages.append((f"windows/{key}", value))
-        
+            yield (f"windows/{key}", value)
+
         for key, value in self.climate.to_dict().items():
-            messages.append((f"climate/{key}", value))
-        
+            yield (f"climate/{key}", value)
+
         for key, value in self.location.to_dict().items():
-            messages.append((f"location/{key}", value))
-        
-        for key, value in self.tires.to_dict().items():
-            messages.append((f"tires/{key}", value))
-        
-        for key, value in self.service.to_dict().items():
-            messages.append((f"service/{key}", value))
-        
-        for key, value in self.engine.to_dict().items():
-            messages.append((f"engine/{key}", value))
-        
+            yield (f"location/{key}", value)
+
+        for section in (self.tires, self.service, self.engine):
+            for topic, key in zip(section._MQTT_TOPICS, section._FIELDS):
+                value = getattr(section, key)
+                if value is not None:
+                    yield (topic, value)
+
         # EU-specific power consumption
         if self.total_power_consumed is not None:
-            messages.append(("ev/total_power_consumed", self.total_power_consumed))
+            yield ("ev/total_power_consumed", self.total_power_consumed)
         if self.total_power_regenerated is not None:
-            messages.append(("ev/total_power_regenerated", self.total_power_regenerated))
+            yield ("ev/total_power_regenerated", self.total_power_regenerated)
         if self.power_consumption_30d is not None:
-            messages.append(("ev/power_consumption_30d", self.power_consumption_30d))
-        
+            yield ("ev/power_consumption_30d", self.power_consumption_30d)
+
         # Status data
-        status_dict = self.status.to_dict()
-        for key, value in status_dict.items():
-            messages.append((f"status/{key}", value))
-        
-        return messages
+        status = self.status
+        yield ("status/last_updated", _iso_utc(status.last_updated))
+        yield ("status/data_source", status.data_source)
+        yield ("status/update_method", status.update_method)
+
+    def to_mqtt_messages(self) -> List[Tuple[str, Union[str, int, float, Dict]]]:
+        """Convert to list of (metric_name, data) tuples for MQTT publishing."""
+        return list(self.iter_mqtt_messages())
+
+
+# (dataclass field, vehicle attribute) pairs copied through unchanged
+_BATTERY_ATTRS: Tuple[Tuple[str, str], ...] = (
+    ("level", "ev_battery_percentage"),
+    ("temperature", "ev_battery_temperature"),
+)
+_EV_ATTRS: Tuple[Tuple[str, str], ...] = (
+    ("range", "ev_driving_range"),
+    ("charge_time_100", "ev_estimated_current_charge_duration"),
+    ("charge_time_target", "ev_target_range_charge_ac"),
+    ("charge_limit", "ev_charge_limits_ac"),
+    ("energy_consumption", "ev_energy_consumption"),
+)
+
+
+def _extract_attrs(vehicle: Any, attrs: Tuple[Tuple[str, str], ...]) -> Dict[str, Any]:
+    """Read each vehicle attribute in attrs, keyed by its dataclass field name."""
+    return {dst: getattr(vehicle, src, None) for dst, src in attrs}
 
 
 def map_battery_data(vehicle: Any) -> BatteryData:
     """Extract battery data from hyundai_kia_connect_api vehicle object."""
     return BatteryData(
-        level=getattr(vehicle, 'ev_battery_percentage', None),
         charging_status=_map_charging_status(
             getattr(vehicle, 'ev_battery_is_charging', None)
         ),
         plug_status=_map_plug_status(
             getattr(vehicle, 'ev_battery_is_plugged_in', None)
         ),
-        temperature=getattr(vehicle, 'ev_battery_temperature', None)
+        **_extract_attrs(vehicle, _BATTERY_ATTRS),
     )
 
 
 def map_ev_data(vehicle: Any) -> EVData:
     """Extract EV data from vehicle object."""
-    return EVData(
-        range=getattr(vehicle, 'ev_driving_range', None),
-        charge_time_100=getattr(vehicle, 'ev_estimated_current_charge_duration', None),
-        charge_time_target=getattr(vehicle, 'ev_target_range_charge_ac', None),
-        charge_limit=getattr(vehicle, 'ev_charge_limits_ac', None),
-        energy_consumption=getattr(vehicle, 'ev_energy_consumption', None)
-    )
+    return EVData(**_extract_attrs(vehicle, _EV_ATTRS))
 
 
 def map_door_data(vehicle: Any) -> DoorData:
@@ -399,8 +486,18 @@ def map_eu_power_consumption(vehicle: Any) -> Tuple[Optional[float], Optional[fl
     )
 
 
-def map_vehicle_data(vehicle: Any, data_source: str, update_method: str) -> VehicleData:
-    """Map complete vehicle data to VehicleData model."""
+def map_vehicle_data(
+    vehicle: Any,
+    data_source: str,
+    update_method: str,
+    timestamp: Optional[datetime] = None,
+) -> VehicleData:
+    """
+    Map complete vehicle data to VehicleData model.
+
+    timestamp (naive UTC) stamps the payload; callers mapping a batch of
+    vehicles can pass one shared value. Defaults to the current time.
+    """
     total_consumed, total_regen, consumption_30d = map_eu_power_consumption(vehicle)
     
     return VehicleData(
@@ -408,7 +505,7 @@ def map_vehicle_data(vehicle: Any, data_source: str, update_method: str) -> Vehi
         battery=map_battery_data(vehicle),
         ev=map_ev_data(vehicle),
         status=StatusData(
-            last_updated=datetime.utcnow(),
+            last_updated=timestamp if timestamp is not None else _utcnow(),
             data_source=data_source,
             update_method=update_method
         ),
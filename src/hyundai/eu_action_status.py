@@ -1,6 +1,7 @@
 """EU-specific action status checking and error handling."""
 
 import asyncio
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, Optional
@@ -66,7 +67,8 @@ class EUActionStatusChecker:
             }
         )
         
-        start_time = datetime.utcnow()
+        # Monotonic clock: elapsed time is immune to wall-clock adjustments
+        start_time = time.monotonic()
         
         while True:
             # Check status
@@ -82,9 +84,9 @@ class EUActionStatusChecker:
                 return status
             
             # Check timeout
-            elapsed = (datetime.utcnow() - start_time).total_seconds()
+            elapsed = time.monotonic() - start_time
             if elapsed >= timeout:
-                logger.warning(f"Action {action_id} timed out after {elapsed}s")
+                logger.warning(f"Action {action_id} timed out after {elapsed:.1f}s")
                 return "TIMEOUT"
             
             # Wait before next poll
@@ -26,7 +26,7 @@ class HyundaiMQTTService:
         self.command_handler: Optional[CommandHandler] = None
         self._shutdown_event: asyncio.Event = asyncio.Event()
 
-    async def _route_mqtt_command(self, topic: str, payload: str) -> None:
+    async def _route_mqtt_command(self, topic: str, payload: bytes) -> None:
         """Route MQTT commands to appropriate handler."""
         if not self.command_handler:
             logger.error("Command handler not initialized")
@@ -170,6 +170,9 @@ class HyundaiMQTTService:
         if self.mqtt_client:
             self.mqtt_client.disconnect()
 
+        if self.api_client:
+            await self.api_client.shutdown()
+
         logger.info("Service shutdown complete")
 
     def signal_handler(self, sig: int, frame: Any) -> None:
@@ -192,7 +195,8 @@ async def main() -> None:
     signal.signal(signal.SIGINT, service.signal_handler)
     signal.signal(signal.SIGTERM, service.signal_handler)
 
-    # Run service
+    # Run service. Queued log records are drained by the atexit hook that
+    # start_logging() registers, after asyncio.run() has finished tearing down.
     await service.run()
 
 
@@ -1,9 +1,8 @@
 """MQTT client wrapper with connection management and publishing."""
 
 import asyncio
-import json
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import paho.mqtt.client as mqtt
 
@@ -11,10 +10,14 @@ from ..config.settings import MQTTConfig
 from ..hyundai.data_mapper import VehicleData
 from ..utils.errors import MQTTConnectionError
 from ..utils.logger import get_logger
+from ..utils.serialization import json_dumps
 from .topics import TOPIC_CONFIG, TopicManager
 
 logger = get_logger(__name__)
 
+# Outbound message: (topic, payload, qos, retain)
+OutboundMessage = Tuple[str, str, int, bool]
+
 
 class MQTTClient:
     """
@@ -84,8 +87,9 @@ class MQTTClient:
         """Route incoming messages to command handler."""
         try:
             topic = msg.topic
-            payload = msg.payload.decode('utf-8')
-            logger.info(f"Received message on topic {topic}: {payload}")
+            # Hand the raw bytes to the command handler; parsers decode only if needed
+            payload = msg.payload
+            logger.info(f"Received message on topic {topic}: {payload!r}")
             
             # Extract vehicle ID from topic
             vehicle_id = self.topic_manager.extract_vehicle_id_from_topic(topic)
@@ -165,6 +169,97 @@ class MQTTClient:
             logger.error(f"Failed to connect to MQTT broker: {e}")
             raise MQTTConnectionError(f"Connection failed: {e}")
 
+    def vehicle_data_messages(self, vehicle_data: VehicleData) -> List[OutboundMessage]:
+        """Build (topic, payload, qos, retain) tuples for all vehicle data metrics."""
+        outbound: List[OutboundMessage] = []
+        
+        # Consume metrics lazily; nothing else needs the intermediate list
+        for metric_path, value in vehicle_data.iter_mqtt_messages():
+            # Build full topic
+            category, sep, metric = metric_path.partition("/")
+            if sep and "/" not in metric:
+                if category == "battery":
+                    topic = self.topic_manager.battery_topic(vehicle_data.vehicle_id, metric)
+                elif category == "ev":
+                    topic = self.topic_manager.ev_topic(vehicle_data.vehicle_id, metric)
+                elif category == "status":
+                    topic = self.topic_manager.status_topic(vehicle_data.vehicle_id, metric)
+                elif category == "doors":
+                    topic = self.topic_manager.door_topic(vehicle_data.vehicle_id, metric)
+                elif category == "windows":
+                    topic = self.topic_manager.window_topic(vehicle_data.vehicle_id, metric)
+                elif category == "climate":
+                    topic = self.topic_manager.climate_topic(vehicle_data.vehicle_id, metric)
+                elif category == "location":
+                    topic = self.topic_manager.location_topic(vehicle_data.vehicle_id, metric)
+                elif category == "tires":
+                    topic = self.topic_manager.tire_topic(vehicle_data.vehicle_id, metric)
+                elif category == "service":
+                    topic = self.topic_manager.service_topic(vehicle_data.vehicle_id, metric)
+                elif category == "engine":
+                    topic = self.topic_manager.engine_topic(vehicle_data.vehicle_id, metric)
+                else:
+                    continue
+                
+                # Get topic configuration
+                config = TOPIC_CONFIG.get(metric_path, {"qos": 0, "retain": False})
+                
+                # Format message
+                if metric_path.startswith("status/"):
+                    # Status messages are already in string format
+                    payload = json_dumps({"value": value, "timestamp": vehicle_data.status.last_updated})
+                else:
+                    unit = config.get("unit")
+                    payload = self.topic_manager.format_message(
+                        value,
+                        unit=unit,
+                        timestamp=vehicle_data.status.last_updated
+                    )
+                
+                outbound.append(
+                    (topic, payload, config.get("qos", 0), config.get("retain", False))
+                )
+        
+        return outbound
+
+    def error_status_message(
+        self, vehicle_id: str, error_data: Optional[Dict[str, Any]]
+    ) -> OutboundMessage:
+        """Build the (topic, payload, qos, retain) tuple for a vehicle error status."""
+        topic = self.topic_manager.status_topic(vehicle_id, "error")
+        
+        # error_data of None clears the error status
+        payload = json_dumps({"value": error_data, "timestamp": datetime.utcnow()})
+        
+        return (topic, payload, 0, True)
+
+    async def publish_batch(self, messages: List[OutboundMessage]) -> bool:
+        """
+        Publish several messages back-to-back without yielding in between.
+        
+        Args:
+            messages: (topic, payload, qos, retain) tuples
+        
+        Returns:
+            True if connected and every message was handed to the broker client
+        """
+        if not self.connected:
+            logger.warning("Not connected to MQTT broker, skipping publish")
+            return False
+        
+        all_sent = True
+        for topic, payload, qos, retain in messages:
+            try:
+                result = self.client.publish(topic, payload, qos=qos, retain=retain)
+                
+                if result.rc != mqtt.MQTT_ERR_SUCCESS:
+                    all_sent = False
+                    logger.warning("Failed to publish to %s: %s", topic, result.rc)
+            except Exception as e:
+                all_sent = False
+                logger.error("Error publishing to %s: %s", topic, e)
+        return all_sent
+
     async def publish_vehicle_data(self, vehicle_data: VehicleData) -> None:
         """Publish all vehicle data to respective topics."""
         if not self.connected:
@@ -172,69 +267,12 @@ class MQTTClient:
             return
         
         try:
-            logger.info(f"Publishing vehicle data for {vehicle_data.vehicle_id}")
-            
-            # Get all messages to publish
-            messages = vehicle_data.to_mqtt_messages()
-            
-            for metric_path, value in messages:
-                # Build full topic
-                parts = metric_path.split("/")
-                if len(parts) == 2:
-                    category, metric = parts
-                    if category == "battery":
-                        topic = self.topic_manager.battery_topic(vehicle_data.vehicle_id, metric)
-                    elif category == "ev":
-                        topic = self.topic_manager.ev_topic(vehicle_data.vehicle_id, metric)
-                    elif category == "status":
-                        topic = self.topic_manager.status_topic(vehicle_data.vehicle_id, metric)
-                    elif category == "doors":
-                        topic = self.topic_manager.door_topic(vehicle_data.vehicle_id, metric)
-                    elif category == "windows":
-                        topic = self.topic_manager.window_topic(vehicle_data.vehicle_id, metric)
-                    elif category == "climate":
-                        topic = self.topic_manager.climate_topic(vehicle_data.vehicle_id, metric)
-                    elif category == "location":
-                        topic = self.topic_manager.location_topic(vehicle_data.vehicle_id, metric)
-                    elif category == "tires":
-                        topic = self.topic_manager.tire_topic(vehicle_data.vehicle_id, metric)
-                    elif category == "service":
-                        topic = self.topic_manager.service_topic(vehicle_data.vehicle_id, metric)
-                    elif category == "engine":
-                        topic = self.topic_manager.engine_topic(vehicle_data.vehicle_id, metric)
-                    else:
-                        continue
-                    
-                    # Get topic configuration
-                    config = TOPIC_CONFIG.get(metric_path, {"qos": 0, "retain": False})
-                    
-                    # Format message
-                    if metric_path.startswith("status/"):
-                        # Status messages are already in string format
-                        payload = json.dumps({"value": value, "timestamp": vehicle_data.status.last_updated.isoformat() + "Z"})
-                    else:
-                        unit = config.get("unit")
-                        payload = self.topic_manager.format_message(
-                            value,
-                            unit=unit,
-                            timestamp=vehicle_data.status.last_updated
-                        )
-                    
-                    # Publish
-                    result = self.client.publish(
-                        topic,
-                        payload,
-                        qos=config.get("qos", 0),
-                        retain=config.get("retain", False)
-                    )
-                    
-                    if result.rc != mqtt.MQTT_ERR_SUCCESS:
-                        logger.warning(f"Failed to publish to {topic}: {result.rc}")
-            
-            logger.info(f"Successfully published data for vehicle {vehicle_data.vehicle_id}")
+            logger.info("Publishing vehicle data for %s", vehicle_data.vehicle_id)
+            await self.publish_batch(self.vehicle_data_messages(vehicle_data))
+            logger.info("Successfully published data for vehicle %s", vehicle_data.vehicle_id)
             
         except Exception as e:
-            logger.error(f"Error publishing vehicle data: {e}")
+            logger.error("Error publishing vehicle data: %s", e)
 
     async def publish(self, topic: str, payload: Any, qos: int = 0, retain: bool = False) -> None:
         """
@@ -253,7 +291,7 @@ class MQTTClient:
         try:
             # Convert payload to string if needed
             if not isinstance(payload, str):
-                payload = json.dumps(payload)
+                payload = json_dumps(payload)
             
             result = self.client.publish(topic, payload, qos=qos, retain=retain)
             
@@ -278,22 +316,9 @@ class MQTTClient:
             return
         
         try:
-            topic = self.topic_manager.status_topic(vehicle_id, "error")
+            topic, payload, qos, retain = self.error_status_message(vehicle_id, error_data)
             
-            if error_data is None:
-                # Clear error status
-                payload = json.dumps({
-                    "value": None,
-                    "timestamp": datetime.utcnow().isoformat() + "Z"
-                })
-            else:
-                # Publish error details
-                payload = json.dumps({
-                    "value": error_data,
-                    "timestamp": datetime.utcnow().isoformat() + "Z"
-                })
-            
-            result = self.client.publish(topic, payload, qos=0, retain=True)
+            result = self.client.publish(topic, payload, qos=qos, retain=retain)
             
             if result.rc != mqtt.MQTT_ERR_SUCCESS:
                 logger.warning(f"Failed to publish error status to {topic}: {result.rc}")
@@ -1,9 +1,11 @@
 """Topic structure and message formatting for MQTT."""
 
-import json
+import re
 from datetime import datetime
 from typing import Any, Dict, Optional, Tuple
 
+from ..utils.serialization import json_dumps
+
 
 class TopicManager:
     """
@@ -12,6 +14,10 @@ class TopicManager:
 
     def __init__(self, base_topic: str = "hyundai") -> None:
         self.base_topic: str = base_topic
+        # {base_topic}/{vehicle_id}/commands/{command_type}[/...], compiled once
+        self._command_topic_re: re.Pattern[str] = re.compile(
+            re.escape(base_topic) + r"/([^/]*)/commands/([^/]*)(?:/|\Z)"
+        )
 
     def battery_topic(self, vehicle_id: str, metric: str) -> str:
         """Format: hyundai/{vehicle_id}/battery/{metric}"""
@@ -39,9 +45,10 @@ class TopicManager:
 
     def extract_vehicle_id_from_topic(self, topic: str) -> Optional[str]:
         """Extract vehicle ID from command topic."""
-        parts = topic.split("/")
-        if len(parts) >= 2:
-            return parts[1]
+        # partition() scans once and avoids building a list of every segment
+        _, sep, rest = topic.partition("/")
+        if sep:
+            return rest.partition("/")[0]
         return None
 
     # ===== Control Command Topics (Input) =====
@@ -126,9 +133,9 @@ class TopicManager:
         Example:
             "hyundai/ABC123/commands/lock" -> ("ABC123", "lock")
         """
-        parts = topic.split("/")
-        if len(parts) >= 4 and parts[0] == self.base_topic and parts[2] == "commands":
-            return (parts[1], parts[3])
+        match = self._command_topic_re.match(topic)
+        if match:
+            return (match.group(1), match.group(2))
         return None
 
     def format_message(self, value: Any, unit: Optional[str] = None, timestamp: Optional[datetime] = None) -> str:
@@ -141,13 +148,13 @@ class TopicManager:
         
         payload: Dict[str, Any] = {
             "value": value,
-            "timestamp": timestamp.isoformat() + "Z"
+            "timestamp": timestamp
         }
         
         if unit:
             payload["unit"] = unit
         
-        return json.dumps(payload)
+        return json_dumps(payload)
 
 
 # Extended topic configuration with QoS and retain settings
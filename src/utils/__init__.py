@@ -8,7 +8,8 @@ from .errors import (
     MQTTConnectionError,
     RefreshError,
 )
-from .logger import get_logger
+from .logger import get_logger, start_logging, stop_logging
+from .serialization import json_dumps, json_loads
 
 __all__ = [
     "CommandError",
@@ -18,4 +19,8 @@ __all__ = [
     "MQTTConnectionError",
     "RefreshError",
     "get_logger",
+    "json_dumps",
+    "json_loads",
+    "start_logging",
+    "stop_logging",
 ]
@@ -1,9 +1,14 @@
 """Structured logging configuration."""
 
+import atexit
+import copy
 import json
 import logging
-from datetime import datetime
-from typing import Any, Dict
+import queue
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
 
 
 class JSONFormatter(logging.Formatter):
@@ -11,8 +16,10 @@ class JSONFormatter(logging.Formatter):
     
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
+        # Stamp when the event was logged, not when the listener thread formats it
+        created = datetime.fromtimestamp(record.created, timezone.utc).replace(tzinfo=None)
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": created.isoformat() + "Z",
             "level": record.levelname,
             "message": record.getMessage(),
             "module": record.module,
@@ -39,6 +46,48 @@ def redact_sensitive(data: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+class _InProcessQueueHandler(QueueHandler):
+    """Queue handler for an in-process listener (records are never pickled)."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge message arguments now, leave JSON formatting to the listener."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# All loggers enqueue records here; a background thread formats and writes them
+# so logging from coroutines never blocks the event loop on stderr I/O.
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_queue_handler: QueueHandler = _InProcessQueueHandler(_log_queue)
+_listener: Optional[QueueListener] = None
+
+
+def start_logging() -> None:
+    """Start the background log listener (idempotent)."""
+    global _listener
+    if _listener is not None:
+        return
+
+    # Console handler with JSON formatting
+    console_handler = logging.StreamHandler(sys.stderr)
+    console_handler.setFormatter(JSONFormatter())
+
+    _listener = QueueListener(_log_queue, console_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging() -> None:
+    """Flush pending records and stop the background log listener."""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    _listener = None
+
+
 def get_logger(name: str, level: str = "INFO") -> logging.Logger:
     """Get configured logger instance."""
     logger = logging.getLogger(name)
@@ -46,9 +95,7 @@ def get_logger(name: str, level: str = "INFO") -> logging.Logger:
     
     # Avoid adding handlers multiple times
     if not logger.handlers:
-        # Console handler with JSON formatting
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(JSONFormatter())
-        logger.addHandler(console_handler)
+        start_logging()
+        logger.addHandler(_queue_handler)
     
     return logger
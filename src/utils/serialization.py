@@ -0,0 +1,29 @@
+"""JSON serialization shared by MQTT payload producers and command parsing."""
+
+import json
+from datetime import datetime
+from typing import Any, Union
+
+
+def _encode_default(obj: Any) -> Any:
+    """Serialize types the stdlib encoder does not handle natively."""
+    if isinstance(obj, datetime):
+        # Naive datetimes in this codebase are UTC
+        if obj.tzinfo is None:
+            return obj.isoformat() + "Z"
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Built once: compact separators, raw UTF-8 (no \u escapes) for smaller payloads
+_encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=_encode_default)
+
+
+def json_dumps(obj: Any) -> str:
+    """Encode obj as compact JSON, formatting datetimes as ISO 8601."""
+    return _encoder.encode(obj)
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Decode JSON from str or raw UTF-8 bytes."""
+    return json.loads(data)
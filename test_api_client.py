@@ -0,0 +1,490 @@
+"""HyundaiAPIClient and CircuitBreaker behaviour against stubbed vendor calls."""
+
+import asyncio
+import threading
+import time
+from collections import Counter
+
+import pytest
+from hyundai_kia_connect_api.const import ORDER_STATUS
+from hyundai_kia_connect_api.exceptions import AuthenticationError
+
+from src.config.settings import HyundaiConfig
+from src.hyundai import api_client
+from src.hyundai.api_client import CircuitBreaker, HyundaiAPIClient
+from src.utils.errors import HyundaiAPIError, RefreshError
+
+CONFIG = HyundaiConfig(username="u", password="p", pin="1", region=1, brand=1)
+
+
+def run_with_client(manager, body, config=CONFIG):
+    """Run body(client) on a fresh event loop with manager as the VehicleManager."""
+    async def main():
+        client = HyundaiAPIClient(config)
+        client._loop = asyncio.get_running_loop()
+        client.vehicle_manager = manager
+        try:
+            return await body(client)
+        finally:
+            await client.shutdown()
+
+    return asyncio.run(main())
+
+
+class FakeClock:
+    """Stand-in for time.monotonic() that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(api_client.time, "monotonic", fake)
+    return fake
+
+
+@pytest.fixture
+def no_jitter(monkeypatch):
+    monkeypatch.setattr(api_client.random, "uniform", lambda a, b: 1.0)
+
+
+# ===== Error handling =====
+
+@pytest.mark.parametrize("error", [
+    KeyError("vehicleStatus"),
+    ValueError("Expecting value"),
+    NotImplementedError("force refresh"),
+    ConnectionError("reset by peer"),
+])
+def test_vendor_failures_are_wrapped_and_recorded(error):
+    def fail(*args):
+        raise error
+
+    async def body(client):
+        with pytest.raises(HyundaiAPIError, match="Lock command failed"):
+            await client._execute_with_retry("Lock command", "V1", fail)
+        return client.circuit_breaker.failure_count
+
+    assert run_with_client(object(), body) == 1
+
+
+def test_programming_errors_propagate_unwrapped():
+    def fail(*args):
+        raise TypeError("unexpected argument")
+
+    async def body(client):
+        with pytest.raises(TypeError):
+            await client._execute_with_retry("Lock command", "V1", fail)
+        return client.circuit_breaker.failure_count
+
+    assert run_with_client(object(), body) == 0
+
+
+def test_unknown_vehicle_is_not_found():
+    class Manager:
+        vehicles = {}
+
+    async def body(client):
+        with pytest.raises(RefreshError, match="Vehicle nope not found"):
+            await client.refresh_cached("nope")
+
+    run_with_client(Manager(), body)
+
+
+# ===== Circuit breaker =====
+
+def test_breaker_opens_at_threshold(clock, no_jitter):
+    breaker = CircuitBreaker(failure_threshold=3, timeout=10, max_timeout=100)
+    for _ in range(2):
+        breaker.record_failure()
+        assert breaker.can_execute()
+    breaker.record_failure()
+    assert breaker.state is api_client._CBState.OPEN
+    assert not breaker.can_execute()
+    assert breaker.current_timeout == 10
+
+
+def test_breaker_reopen_backoff_grows_until_success(clock, no_jitter):
+    breaker = CircuitBreaker(failure_threshold=2, timeout=10, max_timeout=35)
+    breaker.record_failure()
+    breaker.record_failure()
+    timeouts = [breaker.current_timeout]
+
+    for _ in range(3):
+        # Still OPEN until the current timeout has elapsed
+        clock.now += breaker.current_timeout - 1
+        assert not breaker.can_execute()
+        clock.now += 2
+        assert breaker.can_execute()
+        assert breaker.state is api_client._CBState.HALF_OPEN
+        # The trial call fails: re-open with a doubled, capped timeout
+        breaker.record_failure()
+        assert breaker.state is api_client._CBState.OPEN
+        timeouts.append(breaker.current_timeout)
+
+    assert timeouts == [10, 20, 35, 35]
+
+    clock.now += breaker.current_timeout + 1
+    assert breaker.can_execute()
+    breaker.record_success()
+    assert breaker.state is api_client._CBState.CLOSED
+    assert (breaker.failure_count, breaker.open_cycles) == (0, 0)
+
+    # A fresh outage starts again from the base timeout
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.current_timeout == 10
+
+
+def test_breaker_jitter_bounds(clock):
+    breaker = CircuitBreaker(failure_threshold=1, timeout=100, max_timeout=900)
+    breaker.record_failure()
+    assert 80 <= breaker.current_timeout <= 120
+
+
+# ===== Action status polling =====
+
+class StubManager:
+    """VehicleManager stand-in returning scripted action statuses."""
+
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.calls = 0
+
+    def check_action_status(self, vehicle_id, action_id):
+        self.calls += 1
+        if len(self.statuses) > 1:
+            return self.statuses.pop(0)
+        return self.statuses[0]
+
+
+def run_status_check(monkeypatch, manager, synchronous=True, timeout_seconds=5):
+    monkeypatch.setattr(api_client, "_STATUS_POLL_DELAYS", (0.01, 0.02))
+    return run_with_client(manager, lambda client: client.check_action_status(
+        "V1", "action-1", synchronous=synchronous, timeout_seconds=timeout_seconds
+    ))
+
+
+def test_status_polls_until_terminal(monkeypatch):
+    manager = StubManager([ORDER_STATUS.PENDING, ORDER_STATUS.PENDING, ORDER_STATUS.SUCCESS])
+    assert run_status_check(monkeypatch, manager) == "SUCCESS"
+    assert manager.calls == 3
+
+
+def test_status_failed_is_terminal(monkeypatch):
+    manager = StubManager([ORDER_STATUS.PENDING, ORDER_STATUS.FAILED, ORDER_STATUS.SUCCESS])
+    assert run_status_check(monkeypatch, manager) == "FAILED"
+    assert manager.calls == 2
+
+
+def test_status_times_out_at_deadline(monkeypatch):
+    manager = StubManager([ORDER_STATUS.PENDING])
+    assert run_status_check(monkeypatch, manager, timeout_seconds=0.2) == "TIMEOUT"
+    assert 1 <= manager.calls <= 20
+
+
+def test_status_single_check_when_not_synchronous(monkeypatch):
+    manager = StubManager([{"status": "pending"}])
+    assert run_status_check(monkeypatch, manager, synchronous=False) == "PENDING"
+    assert manager.calls == 1
+
+
+# ===== Request coalescing =====
+
+class StubVehicle:
+    def __init__(self, vehicle_id):
+        self.id = vehicle_id
+        self.ev_battery_percentage = 80
+
+
+class RefreshManager:
+    """VehicleManager stand-in counting vendor calls, which block while gate is clear."""
+
+    def __init__(self):
+        self.vehicles = {"V1": StubVehicle("V1")}
+        self.calls = Counter()
+        self.gate = threading.Event()
+        self.gate.set()
+        self.error = None
+
+    def _call(self, name):
+        self.calls[name] += 1
+        self.gate.wait(5)
+        if self.error is not None:
+            raise self.error
+
+    def update_vehicle_with_cached_state(self, vehicle_id):
+        self._call("cached")
+
+    def force_refresh_vehicle_state(self, vehicle_id):
+        self._call("force")
+
+    def check_and_force_update_vehicle(self, max_age_seconds, vehicle_id):
+        self._call("smart")
+
+    def lock(self, vehicle_id):
+        self._call("lock")
+        return "action-1"
+
+
+async def gated(manager, *calls):
+    """Start calls while the vendor is blocked, then release it and gather results."""
+    manager.gate.clear()
+    tasks = [asyncio.ensure_future(call) for call in calls]
+    await asyncio.sleep(0.05)
+    manager.gate.set()
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def test_concurrent_force_refreshes_share_one_call():
+    manager = RefreshManager()
+
+    async def body(client):
+        results = await gated(manager, *(client.refresh_force("V1") for _ in range(3)))
+        assert results[0] is results[1] is results[2]
+        assert manager.calls["force"] == 1
+        # The registry entry goes away with the call, so the next one is fresh
+        assert not client._inflight
+        await client.refresh_force("V1")
+        assert manager.calls["force"] == 2
+
+    run_with_client(manager, body)
+
+
+def test_cancelled_waiter_does_not_cancel_shared_call():
+    manager = RefreshManager()
+
+    async def body(client):
+        manager.gate.clear()
+        first = asyncio.ensure_future(client.refresh_force("V1"))
+        second = asyncio.ensure_future(client.refresh_force("V1"))
+        await asyncio.sleep(0.05)
+        first.cancel()
+        manager.gate.set()
+        data = await second
+        assert data.vehicle_id == "V1"
+        assert first.cancelled()
+        assert manager.calls["force"] == 1
+
+    run_with_client(manager, body)
+
+
+def test_coalescing_is_keyed_by_strategy_and_max_age():
+    manager = RefreshManager()
+
+    async def body(client):
+        await gated(
+            manager,
+            client.refresh_smart("V1", 60),
+            client.refresh_smart("V1", 60),
+            client.refresh_smart("V1", 120),
+            client.refresh_cached("V1"),
+            client.refresh_cached("V1"),
+        )
+        # Same strategy and max_age join; different ones run separately
+        assert manager.calls == {"smart": 2, "cached": 1}
+
+    run_with_client(manager, body)
+
+
+def test_coalesced_failure_reaches_every_waiter():
+    manager = RefreshManager()
+    manager.error = ConnectionError("reset by peer")
+
+    async def body(client):
+        results = await gated(manager, *(client.refresh_cached("V1") for _ in range(3)))
+        assert all(isinstance(result, RefreshError) for result in results)
+        assert manager.calls["cached"] == 1
+        assert not client._inflight
+
+    run_with_client(manager, body)
+
+
+# ===== refresh_cached memo =====
+
+def age_cached(client, vehicle_id, seconds):
+    """Backdate the memoized refresh_cached result by seconds."""
+    stamp, data = client._cached_data[vehicle_id]
+    client._cached_data[vehicle_id] = (stamp - seconds, data)
+
+
+def test_cached_refresh_served_from_memo_within_ttl():
+    manager = RefreshManager()
+
+    async def body(client):
+        first = await client.refresh_cached("V1")
+        assert await client.refresh_cached("V1") is first
+        assert manager.calls["cached"] == 1
+
+        age_cached(client, "V1", api_client._CACHED_REFRESH_TTL)
+        assert await client.refresh_cached("V1") is not first
+        assert manager.calls["cached"] == 2
+
+    run_with_client(manager, body)
+
+
+@pytest.mark.parametrize("invalidate", [
+    lambda client: client.refresh_force("V1"),
+    lambda client: client.refresh_smart("V1", 60),
+    lambda client: client.lock_vehicle("V1"),
+])
+def test_remote_state_changes_evict_cached_memo(invalidate):
+    manager = RefreshManager()
+
+    async def body(client):
+        await client.refresh_cached("V1")
+        await invalidate(client)
+        assert "V1" not in client._cached_data
+        await client.refresh_cached("V1")
+        assert manager.calls["cached"] == 2
+
+    run_with_client(manager, body)
+
+
+# ===== Stale fallback =====
+
+STALE_CONFIG = HyundaiConfig(username="u", password="p", pin="1", region=1, brand=1, allow_stale=True)
+
+
+def test_failed_refresh_serves_stale_data_when_allowed():
+    manager = RefreshManager()
+
+    async def body(client):
+        good = await client.refresh_cached("V1")
+        age_cached(client, "V1", api_client._CACHED_REFRESH_TTL)
+        manager.error = ConnectionError("reset by peer")
+        for refresh in (client.refresh_cached("V1"), client.refresh_smart("V1", 60)):
+            stale = await refresh
+            assert stale.status.data_source == "stale"
+            assert stale.battery == good.battery
+        # The last-known-good copy itself is left untouched
+        assert good.status.data_source == "cached"
+
+    run_with_client(manager, body, config=STALE_CONFIG)
+
+
+@pytest.mark.parametrize("config, warm", [(CONFIG, True), (STALE_CONFIG, False)])
+def test_failed_refresh_raises_without_stale_data(config, warm):
+    manager = RefreshManager()
+
+    async def body(client):
+        if warm:
+            await client.refresh_cached("V1")
+            age_cached(client, "V1", api_client._CACHED_REFRESH_TTL)
+        manager.error = ConnectionError("reset by peer")
+        with pytest.raises(RefreshError):
+            await client.refresh_cached("V1")
+
+    run_with_client(manager, body, config=config)
+
+
+# ===== Token refresh =====
+
+class TokenManager:
+    """VehicleManager stand-in counting token refreshes."""
+
+    def __init__(self):
+        self.refreshes = 0
+
+    def check_and_refresh_token(self):
+        self.refreshes += 1
+
+
+def expire_once(barrier=None):
+    """A vendor call that fails with an expired token on its first invocation."""
+    calls = []
+
+    def call(*args):
+        calls.append(args)
+        if len(calls) == 1:
+            if barrier is not None:
+                barrier.wait()
+            raise AuthenticationError("Token expired")
+        return "ok"
+
+    return call
+
+
+def test_token_recently_refreshed_compares_against_failure_time():
+    client = HyundaiAPIClient(CONFIG)
+    assert not client._token_recently_refreshed(100.0)
+    client._last_refresh_monotonic = 100.0
+    assert client._token_recently_refreshed(99.0)  # Refreshed after the call started
+    assert not client._token_recently_refreshed(101.0)  # Call started after the refresh
+
+
+def test_token_refreshed_again_for_call_started_after_last_refresh():
+    manager = TokenManager()
+
+    async def body(client):
+        # Well inside the old 30s skip window, but this call's token is newer
+        client._last_refresh_monotonic = time.monotonic() - 1
+        result = await client._execute_with_retry("Lock command", "V1", expire_once())
+        assert result == "ok"
+        assert manager.refreshes == 1
+
+    run_with_client(manager, body)
+
+
+def test_concurrent_token_failures_refresh_once():
+    manager = TokenManager()
+    # All three calls see the expired token before any refresh completes
+    barrier = threading.Barrier(3, timeout=5)
+
+    async def body(client):
+        results = await asyncio.gather(*(
+            client._execute_with_retry("Cached refresh", vehicle_id, expire_once(barrier))
+            for vehicle_id in ("V1", "V2", "V3")
+        ))
+        assert results == ["ok"] * 3
+        assert manager.refreshes == 1
+
+    run_with_client(manager, body)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record token retry backoff delays instead of sleeping."""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(api_client.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(api_client.random, "random", lambda: 0.5)
+    return delays
+
+
+def test_token_retries_are_bounded_with_backoff(sleeps):
+    manager = TokenManager()
+    calls = []
+
+    def always_expired(*args):
+        calls.append(args)
+        raise AuthenticationError("Token expired")
+
+    async def body(client):
+        with pytest.raises(HyundaiAPIError, match="Lock command failed"):
+            await client._execute_with_retry("Lock command", "V1", always_expired)
+        return client.circuit_breaker.failure_count
+
+    assert run_with_client(manager, body) == 1
+    assert len(calls) == api_client._MAX_TOKEN_RETRIES + 1
+    assert manager.refreshes == api_client._MAX_TOKEN_RETRIES
+    # No delay before the first retry, then 2**attempt seconds plus jitter
+    assert sleeps == [2.5]
+
+
+def test_first_token_retry_is_immediate(sleeps):
+    manager = TokenManager()
+
+    async def body(client):
+        return await client._execute_with_retry("Lock command", "V1", expire_once())
+
+    assert run_with_client(manager, body) == "ok"
+    assert sleeps == []
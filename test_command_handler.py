@@ -0,0 +1,228 @@
+"""CommandHandler queueing, tracking and publishing behaviour."""
+
+import asyncio
+
+import paho.mqtt.client as mqtt
+
+from src.commands.handler import CommandHandler, LockCommand, RefreshCommand
+from src.config.settings import MQTTConfig
+from src.hyundai.data_mapper import map_vehicle_data
+from src.mqtt.client import MQTTClient
+
+MQTT_CONFIG = MQTTConfig(
+    broker_host="localhost",
+    broker_port=1883,
+    username=None,
+    password=None,
+    use_tls=False,
+    client_id="test",
+    qos_level=1,
+    base_topic="hyundai",
+)
+ERROR_TOPIC = "hyundai/V1/status/error"
+
+
+class PublishResult:
+    def __init__(self, rc):
+        self.rc = rc
+
+
+class FakePaho:
+    """Records publishes; topics in fail_next fail once with a non-success rc."""
+
+    def __init__(self):
+        self.published = []
+        self.fail_next = set()
+
+    def publish(self, topic, payload, qos=0, retain=False):
+        if topic in self.fail_next:
+            self.fail_next.discard(topic)
+            return PublishResult(mqtt.MQTT_ERR_NO_CONN)
+        self.published.append(topic)
+        return PublishResult(mqtt.MQTT_ERR_SUCCESS)
+
+
+class StubVehicle:
+    id = "V1"
+    ev_battery_percentage = 80
+
+
+class StubAPIClient:
+    """Refreshes return mapped data for a fixed vehicle; actions finish on release."""
+
+    def __init__(self):
+        self.calls = []
+        self.release = asyncio.Event()
+
+    async def refresh_cached(self, vehicle_id):
+        self.calls.append(("cached", vehicle_id))
+        return map_vehicle_data(StubVehicle(), "cached", "cached")
+
+    async def refresh_force(self, vehicle_id):
+        self.calls.append(("force", vehicle_id))
+        return map_vehicle_data(StubVehicle(), "fresh", "force")
+
+    async def refresh_smart(self, vehicle_id, max_age_seconds):
+        self.calls.append(("smart", vehicle_id))
+        return map_vehicle_data(StubVehicle(), "cached", "smart")
+
+    async def lock_vehicle(self, vehicle_id):
+        self.calls.append(("lock", vehicle_id))
+        return f"action-{len(self.calls)}"
+
+    async def check_action_status(self, vehicle_id, action_id, synchronous=True, timeout_seconds=60):
+        await self.release.wait()
+        return "SUCCESS"
+
+
+def make_handler():
+    mqtt_client = MQTTClient(MQTT_CONFIG)
+    mqtt_client.client = FakePaho()
+    mqtt_client.connected = True
+    handler = CommandHandler(StubAPIClient(), mqtt_client)
+    handler._min_command_interval = 0  # No throttling between test commands
+    return handler, mqtt_client.client
+
+
+def refresh(vehicle_id="V1"):
+    return RefreshCommand("cached", vehicle_id)
+
+
+# ===== Error status clearing =====
+
+def test_error_clear_retried_until_sent():
+    handler, paho = make_handler()
+
+    async def main():
+        # The first success after start-up clears any retained error, but the
+        # clear is lost on the way out
+        paho.fail_next.add(ERROR_TOPIC)
+        await handler.handle_command(refresh())
+        assert ERROR_TOPIC not in paho.published
+
+        # So the next success sends it again
+        await handler.handle_command(refresh())
+        assert paho.published.count(ERROR_TOPIC) == 1
+
+        # Once delivered, further successes skip it
+        await handler.handle_command(refresh())
+        assert paho.published.count(ERROR_TOPIC) == 1
+
+    asyncio.run(main())
+
+
+def test_error_clear_not_marked_while_disconnected():
+    handler, paho = make_handler()
+    handler.mqtt_client.connected = False
+
+    async def main():
+        await handler.handle_command(refresh())
+        handler.mqtt_client.connected = True
+        await handler.handle_command(refresh())
+        assert paho.published.count(ERROR_TOPIC) == 1
+
+    asyncio.run(main())
+
+
+def test_error_clear_sent_after_failure():
+    handler, paho = make_handler()
+
+    async def main():
+        await handler.handle_command(refresh())
+        handler._mark_error("V1", True)  # As a failed command does
+        await handler.handle_command(refresh())
+        assert paho.published.count(ERROR_TOPIC) == 2
+
+    asyncio.run(main())
+
+
+def test_publish_batch_reports_failures():
+    mqtt_client = MQTTClient(MQTT_CONFIG)
+    mqtt_client.client = FakePaho()
+    messages = [("hyundai/V1/battery/level", "{}", 0, False), (ERROR_TOPIC, "{}", 0, True)]
+
+    async def main():
+        assert await mqtt_client.publish_batch(messages) is False  # Disconnected
+        mqtt_client.connected = True
+        assert await mqtt_client.publish_batch(messages) is True
+        mqtt_client.client.fail_next.add(ERROR_TOPIC)
+        assert await mqtt_client.publish_batch(messages) is False
+
+    asyncio.run(main())
+
+
+# ===== Bounded queues =====
+
+def test_refresh_queue_drops_and_counts_overflow():
+    handler, _ = make_handler()
+
+    async def main():
+        for i in range(300):
+            await handler.enqueue_command(f"hyundai/V{i}/commands/refresh", b"force")
+        assert handler._command_queue.qsize() == 256
+        assert handler._dropped_commands == 44
+        # Dropped commands are not remembered as pending
+        assert len(handler._pending_refresh_keys) == 256
+
+    asyncio.run(main())
+
+
+def test_control_queue_drops_and_counts_overflow():
+    handler, _ = make_handler()
+
+    async def main():
+        for _ in range(300):
+            await handler.enqueue_control_command("hyundai/V1/commands/lock", b'{"action": "lock"}')
+        assert handler._control_command_queue.qsize() == 256
+        assert handler._dropped_control_commands == 44
+
+    asyncio.run(main())
+
+
+# ===== Pending refresh deduplication =====
+
+def test_identical_queued_refreshes_are_deduplicated():
+    handler, _ = make_handler()
+    topic = "hyundai/V1/commands/refresh"
+
+    async def main():
+        for payload in (b"force", b"force", b"smart:60", b"smart:60", b"smart:120"):
+            await handler.enqueue_command(topic, payload)
+        assert handler._command_queue.qsize() == 3
+
+        # Taking the commands off the queue releases their keys
+        processor = asyncio.create_task(handler.process_commands())
+        for _ in range(100):
+            if len(handler.api_client.calls) == 3:
+                break
+            await asyncio.sleep(0.01)
+        processor.cancel()
+        assert [call[0] for call in handler.api_client.calls] == ["force", "smart", "smart"]
+        assert not handler._pending_refresh_keys
+
+        await handler.enqueue_command(topic, b"force")
+        assert handler._command_queue.qsize() == 1
+
+    asyncio.run(main())
+
+
+# ===== Action tracking =====
+
+def test_active_actions_evict_oldest_past_cap():
+    handler, _ = make_handler()
+    handler._max_active_actions = 2
+
+    async def main():
+        for _ in range(3):
+            await handler.handle_control_command(LockCommand("lock", "V1"))
+        assert list(handler._active_actions) == ["action-2", "action-3"]
+
+        # Finished actions stop being tracked
+        handler.api_client.release.set()
+        for _ in range(100):
+            if not handler._active_actions:
+                break
+            await asyncio.sleep(0.01)
+        assert not handler._active_actions
+
+    asyncio.run(main())
@@ -0,0 +1,143 @@
+"""Accept/reject tables for refresh and control command parsing."""
+
+import pytest
+
+from src.commands.handler import (
+    ChargePortCommand,
+    ChargingCurrentCommand,
+    ClimateCommand,
+    ControlCommand,
+    LockCommand,
+    RefreshCommand,
+    WindowsCommand,
+)
+from src.mqtt.topics import TopicManager
+from src.utils.errors import CommandError
+
+VEHICLE_ID = "V1"
+TOPIC_MANAGER = TopicManager("hyundai")
+
+
+def parse_control(command_type, payload):
+    return ControlCommand.parse(
+        f"hyundai/{VEHICLE_ID}/commands/{command_type}", payload, TOPIC_MANAGER
+    )
+
+
+# ===== Refresh commands =====
+
+@pytest.mark.parametrize("payload, command_type, max_age", [
+    (b"cached", "cached", None),
+    (b"force", "force", None),
+    (b" force\n", "force", None),
+    (b"smart:300", "smart", 300),
+    (b"smart : 60", "smart", 60),
+    # Anything after the colon is ignored for non-smart commands
+    (b"force:10", "force", None),
+    (b"force:", "force", None),
+    (b"cached:foo", "cached", None),
+    (b"cached:\xff", "cached", None),
+])
+def test_refresh_accepts(payload, command_type, max_age):
+    command = RefreshCommand.parse(f"hyundai/{VEHICLE_ID}/commands/refresh", payload)
+    assert command.vehicle_id == VEHICLE_ID
+    assert command.command_type == command_type
+    assert command.max_age_seconds == max_age
+
+
+@pytest.mark.parametrize("topic, payload", [
+    ("", b"force"),
+    ("hyundai/V1/commands/refresh", b""),
+    ("hyundai/V1/commands/refresh", "force"),  # payloads are raw bytes, not str
+    ("hyundai/V1/commands/refresh\n", b"force"),
+    ("x/y/V1/commands/refresh", b"force"),  # base topic is a single level
+    ("hyundai/V 1/commands/refresh", b"force"),
+    ("hyundai/V1/commands/refresh", b"refresh"),
+    ("hyundai/V1/commands/refresh", b"forced"),
+    ("hyundai/V1/commands/refresh", b"smart"),
+    ("hyundai/V1/commands/refresh", b"smart:"),
+    ("hyundai/V1/commands/refresh", b"smart:abc"),
+    ("hyundai/V1/commands/refresh", b"smart:0"),
+    ("hyundai/V1/commands/refresh", b"smart:604801"),
+    ("hyundai/V1/commands/refresh", b"smart:99999999"),
+])
+def test_refresh_rejects(topic, payload):
+    with pytest.raises(CommandError):
+        RefreshCommand.parse(topic, payload)
+
+
+# ===== Control commands =====
+
+@pytest.mark.parametrize("command_type, payload, expected", [
+    ("lock", b'{"action": "lock"}', LockCommand("lock", VEHICLE_ID)),
+    ("lock", b'{"action": "unlock"}', LockCommand("unlock", VEHICLE_ID)),
+    ("charge_port", b'{"action": "open"}', ChargePortCommand("open", VEHICLE_ID)),
+    ("charging_current", b'{"level": 2}', ChargingCurrentCommand(2, VEHICLE_ID)),
+    ("windows", b'{"front_left": 1, "back_right": 0}',
+     WindowsCommand(VEHICLE_ID, front_left=1, back_right=0)),
+    ("windows", b"{}", WindowsCommand(VEHICLE_ID)),
+    ("climate", b'{"action": "stop_climate"}', ClimateCommand("stop_climate", VEHICLE_ID)),
+    ("climate",
+     b'{"action": "start_climate", "set_temp": 21.5, "duration": 10, "defrost": true,'
+     b' "climate": false, "steering_wheel": 4, "front_left_seat": 8}',
+     ClimateCommand("start_climate", VEHICLE_ID, set_temp=21.5, duration=10, defrost=True,
+                    climate=False, steering_wheel=4, front_left_seat=8)),
+    ("climate", b'{"action": "start_climate", "set_temp": 21}',
+     ClimateCommand("start_climate", VEHICLE_ID, set_temp=21)),
+    ("climate", b'{"action": "start_climate", "set_temp": null}',
+     ClimateCommand("start_climate", VEHICLE_ID)),
+    # Stringly-typed values are normalised
+    ("charging_current", b'{"level": "2"}', ChargingCurrentCommand(2, VEHICLE_ID)),
+    ("charging_current", b'{"level": 1.0}', ChargingCurrentCommand(1, VEHICLE_ID)),
+    ("windows", b'{"front_left": "1", "front_right": 2.0}',
+     WindowsCommand(VEHICLE_ID, front_left=1, front_right=2)),
+    ("climate",
+     b'{"action": "start_climate", "set_temp": "21.5", "duration": "10", "defrost": "true",'
+     b' "climate": 0, "front_left_seat": 8.0}',
+     ClimateCommand("start_climate", VEHICLE_ID, set_temp=21.5, duration=10, defrost=True,
+                    climate=False, front_left_seat=8)),
+])
+def test_control_accepts(command_type, payload, expected):
+    command = parse_control(command_type, payload)
+    assert command == expected
+    assert type(command) is type(expected)
+
+
+def test_control_normalises_types():
+    command = parse_control("climate", b'{"action": "start_climate", "duration": "10", "defrost": 1}')
+    assert type(command.duration) is int
+    assert command.defrost is True
+
+
+@pytest.mark.parametrize("command_type, payload", [
+    # Unknown command type and malformed JSON
+    ("honk", b'{"action": "lock"}'),
+    ("lock", b"not json"),
+    ("lock", b'["lock"]'),
+    # Required fields and allowed values
+    ("lock", b"{}"),
+    ("lock", b'{"action": "open"}'),
+    ("lock", b'{"action": ["lock"]}'),
+    ("charge_port", b'{"action": "lock"}'),
+    ("charging_current", b"{}"),
+    ("charging_current", b'{"level": 4}'),
+    ("charging_current", b'{"level": "4"}'),
+    ("windows", b'{"front_left": 3}'),
+    ("windows", b'{"sunroof_only": 1, "back_left": false}'),
+    ("climate", b'{"action": "start"}'),
+    # Values that do not normalise to the field's type
+    ("charging_current", b'{"level": true}'),
+    ("charging_current", b'{"level": 1.5}'),
+    ("charging_current", b'{"level": "two"}'),
+    ("climate", b'{"action": "start_climate", "set_temp": "warm"}'),
+    ("climate", b'{"action": "start_climate", "set_temp": "nan"}'),
+    ("climate", b'{"action": "start_climate", "set_temp": true}'),
+    ("climate", b'{"action": "start_climate", "duration": 10.5}'),
+    ("climate", b'{"action": "start_climate", "climate": 2}'),
+    ("climate", b'{"action": "start_climate", "defrost": "yes"}'),
+    ("climate", b'{"action": "start_climate", "steering_wheel": true}'),
+    ("climate", b'{"action": "start_climate", "front_left_seat": [1]}'),
+])
+def test_control_rejects(command_type, payload):
+    with pytest.raises(CommandError):
+        parse_control(command_type, payload)
@@ -0,0 +1,128 @@
+"""Configuration loading and environment schema validation."""
+
+import os
+
+import pytest
+
+from src.config.settings import (
+    AppConfig, HyundaiConfig, MQTTConfig, _validate_env, load_config
+)
+from src.utils.errors import ConfigurationError
+
+CREDENTIALS = {
+    "HYUNDAI_USERNAME": "user",
+    "HYUNDAI_PASSWORD": "secret",
+    "HYUNDAI_PIN": "1234",
+}
+
+
+# ===== Schema =====
+
+def test_defaults():
+    config = AppConfig.from_env(dict(CREDENTIALS))
+    assert config.initial_refresh is True
+    assert config.hyundai == HyundaiConfig(
+        username="user", password="secret", pin="1234", region=1, brand=1
+    )
+    assert config.mqtt.broker_port == 1883
+    assert config.mqtt.qos_level == 1
+    assert config.mqtt.use_tls is False
+
+
+def test_converted_values():
+    env = {
+        **CREDENTIALS,
+        "HYUNDAI_REGION": "3",
+        "HYUNDAI_BRAND": "2",
+        "HYUNDAI_API_THREAD_WORKERS": "4",
+        "HYUNDAI_ALLOW_STALE": " Yes",
+        "MQTT_BROKER_PORT": "8883",
+        "MQTT_QOS": "0",
+        "MQTT_USE_TLS": "on",
+        "INITIAL_REFRESH": "0",
+    }
+    _validate_env(env)
+    config = AppConfig.from_env(env)
+    assert (config.hyundai.region, config.hyundai.brand) == (3, 2)
+    assert config.hyundai.api_thread_workers == 4
+    assert config.hyundai.allow_stale is True
+    assert (config.mqtt.broker_port, config.mqtt.qos_level, config.mqtt.use_tls) == (8883, 0, True)
+    assert config.initial_refresh is False
+
+
+def test_validate_env_reports_every_problem():
+    env = {
+        "HYUNDAI_PASSWORD": "",
+        "HYUNDAI_REGION": "9",
+        "HYUNDAI_BRAND": "kia",
+        "HYUNDAI_API_THREAD_WORKERS": "0",
+        "MQTT_BROKER_PORT": "70000",
+        "MQTT_QOS": "3",
+        "MQTT_USE_TLS": "maybe",
+    }
+    with pytest.raises(ConfigurationError) as excinfo:
+        _validate_env(env)
+    lines = str(excinfo.value).splitlines()
+    assert lines[0] == "Invalid configuration:"
+    assert lines[1:] == [
+        "HYUNDAI_USERNAME is required",
+        "HYUNDAI_PASSWORD='' is invalid, expected a non-empty value",
+        "HYUNDAI_PIN is required",
+        "HYUNDAI_REGION='9' is invalid, expected one of [1, 2, 3, 4, 5, 6, 7, 8]",
+        "HYUNDAI_BRAND='kia' is invalid, expected one of [1, 2, 3]",
+        "HYUNDAI_API_THREAD_WORKERS='0' is invalid, expected a positive integer",
+        "MQTT_BROKER_PORT='70000' is invalid, expected a port between 1 and 65535",
+        "MQTT_QOS='3' is invalid, expected 0, 1 or 2",
+        "MQTT_USE_TLS='maybe' is invalid, expected a boolean",
+    ]
+
+
+@pytest.mark.parametrize("name, value", [
+    ("MQTT_BROKER_PORT", "70000"),
+    ("MQTT_BROKER_PORT", "0"),
+    ("MQTT_QOS", "-1"),
+    ("MQTT_USE_TLS", "2"),
+])
+def test_mqtt_section_uses_schema(name, value):
+    # Section loaders apply the same rules as load_config()'s up-front check
+    with pytest.raises(ConfigurationError, match=name):
+        MQTTConfig.from_env({name: value})
+
+
+@pytest.mark.parametrize("name, value", [
+    ("HYUNDAI_REGION", "0"),
+    ("HYUNDAI_BRAND", "4"),
+    ("HYUNDAI_API_THREAD_WORKERS", "-2"),
+    ("HYUNDAI_ALLOW_STALE", "sometimes"),
+])
+def test_hyundai_section_uses_schema(name, value):
+    with pytest.raises(ConfigurationError, match=name):
+        HyundaiConfig.from_env({**CREDENTIALS, name: value})
+
+
+# ===== .env loading =====
+
+@pytest.fixture
+def dotenv_dir(tmp_path, monkeypatch):
+    """Run in an empty directory with a clean environment and config cache."""
+    monkeypatch.chdir(tmp_path)
+    for name in (*CREDENTIALS, "HTTPS_PROXY", "MQTT_BROKER_PORT"):
+        monkeypatch.delenv(name, raising=False)
+    load_config.cache_clear()
+    yield tmp_path
+    load_config.cache_clear()
+
+
+def test_dotenv_feeds_config_and_process_environment(dotenv_dir, monkeypatch):
+    (dotenv_dir / ".env").write_text(
+        "HYUNDAI_USERNAME=user\nHYUNDAI_PASSWORD=secret\nHYUNDAI_PIN=1234\n"
+        "MQTT_BROKER_PORT=1884\nHTTPS_PROXY=http://proxy:3128\n"
+    )
+    monkeypatch.setenv("MQTT_BROKER_PORT", "8883")
+    config = load_config()
+    # The process environment wins over .env
+    assert config.mqtt.broker_port == 8883
+    assert os.environ["MQTT_BROKER_PORT"] == "8883"
+    # .env values reach os.environ for the vendor library and requests
+    assert os.environ["HTTPS_PROXY"] == "http://proxy:3128"
+    assert config.hyundai.username == "user"
@@ -4,13 +4,9 @@ Test script to simulate and debug MQTT command flow.
 """
 
 import asyncio
-import sys
 from unittest.mock import Mock, AsyncMock, MagicMock
 import logging
 
-# Setup path
-sys.path.insert(0, '/workspaces/hyundai_mqtt')
-
 # Configure logging to see everything
 logging.basicConfig(
     level=logging.DEBUG,
@@ -32,10 +28,10 @@ async def test_message_flow():
     
     # Test data
     topic = "hyundai/fb9ccccc-11111111-1111-1111-1111-111111111111/commands/refresh"
-    payload = "force"
+    payload = b"force"  # paho delivers raw bytes
     
     print(f"Test Topic: {topic}")
-    print(f"Test Payload: {payload}\n")
+    print(f"Test Payload: {payload!r}\n")
     
     # Step 1: Test topic manager extraction
     print("STEP 1: Testing TopicManager.extract_vehicle_id_from_topic()")
@@ -67,6 +63,9 @@ async def test_message_flow():
     mock_mqtt_client = Mock()
     mock_mqtt_client.publish_vehicle_data = AsyncMock()
     mock_mqtt_client.publish_error_status = AsyncMock()
+    mock_mqtt_client.publish_batch = AsyncMock()
+    mock_mqtt_client.vehicle_data_messages = Mock(return_value=[])
+    mock_mqtt_client.error_status_message = Mock(return_value=("hyundai/test/status/error", "{}", 0, True))
     
     # Create command handler
     command_handler = CommandHandler(mock_api_client, mock_mqtt_client)
@@ -92,8 +91,7 @@ async def test_message_flow():
     # Verify API calls
     print(f"\nVerifying API calls:")
     print(f"  - refresh_force called: {mock_api_client.refresh_force.called}")
-    print(f"  - publish_vehicle_data called: {mock_mqtt_client.publish_vehicle_data.called}")
-    print(f"  - publish_error_status called: {mock_mqtt_client.publish_error_status.called}")
+    print(f"  - publish_batch called: {mock_mqtt_client.publish_batch.called}")
     print()
     
     # Step 5: Test async callback scheduling (simulated)
@@ -112,7 +110,7 @@ async def test_message_flow():
         """Simulates what _on_message does in paho-mqtt thread."""
         print("\n  [Simulated MQTT thread]")
         print(f"  Topic: {topic}")
-        print(f"  Payload: {payload}")
+        print(f"  Payload: {payload!r}")
         
         # Schedule coroutine in event loop
         future = asyncio.run_coroutine_threadsafe(
@@ -166,7 +164,7 @@ async def test_message_flow():
     class FakeMessage:
         def __init__(self, topic, payload):
             self.topic = topic
-            self.payload = payload.encode('utf-8')
+            self.payload = payload
     
     fake_msg = FakeMessage(topic, payload)
     